@@ -0,0 +1,111 @@
+import sys
+import json
+import time
+import argparse
+import platform
+import tracemalloc
+from collections import OrderedDict
+from itertools import chain
+
+import sw_excel_parser
+from benchmarks.workbook import FIELD_TYPES, make_parser_class, make_workbook
+
+
+def measure(results: dict, phase: str, rows: int, func, *args, **kwargs):
+    if tracemalloc.is_tracing():
+        tracemalloc.clear_traces()
+        if hasattr(tracemalloc, 'reset_peak'):
+            tracemalloc.reset_peak()
+
+        result = func(*args, **kwargs)
+        results[phase]['peak_memory'] = tracemalloc.get_traced_memory()[1]
+    else:
+        started_at = time.perf_counter()
+        result = func(*args, **kwargs)
+        seconds = time.perf_counter() - started_at
+
+        results[phase] = OrderedDict(
+            seconds=round(seconds, 6),
+            rows=rows,
+            rows_per_sec=round(rows / seconds, 1) if seconds and rows else None,
+            peak_memory=None,
+        )
+
+    return result
+
+
+def validate_items(items: list) -> None:
+    for item in items:
+        item.validate()
+
+
+def run_phases(phases: dict, parser_class: type, file_contents: bytes, total_rows: int) -> None:
+    parser = measure(phases, 'open', 0, parser_class, file_contents=file_contents)
+    engine = parser.engine
+    measure(phases, 'find_headers', 0, engine.find_headers)
+    measure(phases, 'prepare_items', total_rows, engine.prepare_items)
+
+    items = list(chain.from_iterable(engine.values()))
+    measure(phases, 'validate', len(items), validate_items, items)
+    measure(phases, 'compute_stats', len(items), engine.compute_stats)
+    measure(phases, 'collect_errors', len(items), engine.collect_errors)
+
+
+def run(options: argparse.Namespace) -> dict:
+    file_contents = make_workbook(
+        rows=options.rows,
+        columns=options.columns,
+        sheets=options.sheets,
+        error_rate=options.error_rate,
+        field_types=options.field_types,
+        seed=options.seed,
+    )
+    parser_class = make_parser_class(options.columns, options.field_types)
+    total_rows = options.rows * options.sheets
+
+    phases = OrderedDict()
+    run_phases(phases, parser_class, file_contents, total_rows)
+
+    tracemalloc.start()
+    try:
+        run_phases(phases, parser_class, file_contents, total_rows)
+    finally:
+        tracemalloc.stop()
+
+    return OrderedDict(
+        version=sw_excel_parser.__version__,
+        python=platform.python_version(),
+        config=OrderedDict(
+            rows=options.rows,
+            columns=options.columns,
+            sheets=options.sheets,
+            error_rate=options.error_rate,
+            field_types=options.field_types,
+            seed=options.seed,
+            file_size=len(file_contents),
+        ),
+        phases=phases,
+    )
+
+
+def main(argv: list = None) -> None:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description='sw-excel-parser benchmarks')
+    parser.add_argument('--rows', type=int, default=10000)
+    parser.add_argument('--columns', type=int, default=10)
+    parser.add_argument('--sheets', type=int, default=1)
+    parser.add_argument('--error-rate', type=float, default=0.01)
+    parser.add_argument('--field-types', nargs='+', choices=list(FIELD_TYPES), default=list(FIELD_TYPES))
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help='write JSON results to this file instead of stdout')
+    options = parser.parse_args(argv)
+
+    results = json.dumps(run(options), indent=2)
+    if options.output:
+        with open(options.output, 'w') as output_file:
+            output_file.write(results + '\n')
+    else:
+        sys.stdout.write(results + '\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,122 @@
+import io
+import random
+import zipfile
+import datetime
+from collections import OrderedDict
+from xml.sax.saxutils import escape, quoteattr
+
+from sw_excel_parser import fields
+from sw_excel_parser import parsers
+
+MAIN_NS = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+REL_NS = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+PACKAGE_REL_NS = 'http://schemas.openxmlformats.org/package/2006/relationships'
+EXCEL_EPOCH = datetime.date(1899, 12, 30)
+
+FIELD_TYPES = OrderedDict(
+    char=fields.CharField,
+    integer=fields.IntegerField,
+    float=fields.FloatField,
+    date=fields.DateField,
+    email=fields.EmailField,
+)
+
+
+def column_reference(index: int) -> str:
+    reference = ''
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        reference = chr(ord('A') + remainder) + reference
+
+    return reference
+
+
+def get_columns(columns: int, field_types: list) -> list:
+    return [('{}_{}'.format(field_types[index % len(field_types)], index), field_types[index % len(field_types)])
+            for index in range(columns)]
+
+
+def make_parser_class(columns: int, field_types: list) -> type:
+    attrs = {
+        name: FIELD_TYPES[field_type](header=name, required=True)
+        for name, field_type in get_columns(columns, field_types)
+    }
+
+    return type('BenchmarkParser', (parsers.Parser,), attrs)
+
+
+def make_cell(reference: str, field_type: str, valid: bool, rand: random.Random) -> str:
+    if not valid:
+        return '<c r="{}" t="inlineStr"><is><t>invalid value</t></is></c>'.format(reference)
+
+    if field_type == 'integer':
+        return '<c r="{}"><v>{}</v></c>'.format(reference, rand.randint(1, 10 ** 6))
+    elif field_type == 'float':
+        return '<c r="{}"><v>{}</v></c>'.format(reference, rand.uniform(1, 10 ** 6))
+    elif field_type == 'date':
+        serial = (datetime.date(2000, 1, 1) - EXCEL_EPOCH).days + rand.randint(0, 9000)
+        return '<c r="{}" s="1"><v>{}</v></c>'.format(reference, serial)
+    elif field_type == 'email':
+        value = 'user{}@example.com'.format(rand.randint(1, 10 ** 6))
+    else:
+        value = 'value {}'.format(rand.randint(1, 1000))
+
+    return '<c r="{}" t="inlineStr"><is><t>{}</t></is></c>'.format(reference, escape(value))
+
+
+def make_sheet(rows: int, columns: list, error_rate: float, rand: random.Random) -> bytes:
+    header = ''.join(
+        '<c r="{}1" t="inlineStr"><is><t>{}</t></is></c>'.format(column_reference(index), escape(name))
+        for index, (name, field_type) in enumerate(columns)
+    )
+    parts = ['<worksheet xmlns="{}"><sheetData><row r="1">{}</row>'.format(MAIN_NS, header)]
+
+    for nrow in range(2, rows + 2):
+        cells = ''.join(
+            make_cell('{}{}'.format(column_reference(index), nrow), field_type, rand.random() >= error_rate, rand)
+            for index, (name, field_type) in enumerate(columns)
+        )
+        parts.append('<row r="{}">{}</row>'.format(nrow, cells))
+
+    parts.append('</sheetData></worksheet>')
+
+    return ''.join(parts).encode('utf-8')
+
+
+def make_workbook(rows: int = 1000, columns: int = 10, sheets: int = 1, error_rate: float = 0.0,
+                  field_types: list = None, seed: int = 0) -> bytes:
+    rand = random.Random(seed)
+    field_types = field_types or list(FIELD_TYPES)
+    sheet_columns = get_columns(columns, field_types)
+
+    workbook = '<workbook xmlns="{}" xmlns:r="{}"><sheets>{}</sheets></workbook>'.format(
+        MAIN_NS, REL_NS,
+        ''.join(
+            '<sheet name={} sheetId="{}" r:id="rId{}"/>'.format(quoteattr('Sheet{}'.format(index + 1)), index + 1, index + 1)
+            for index in range(sheets)
+        )
+    )
+    relationships = '<Relationships xmlns="{}">{}</Relationships>'.format(
+        PACKAGE_REL_NS,
+        ''.join(
+            '<Relationship Id="rId{0}" Target="worksheets/sheet{0}.xml" Type="{1}/worksheet"/>'.format(index + 1, REL_NS)
+            for index in range(sheets)
+        )
+    )
+    styles = (
+        '<styleSheet xmlns="{}"><cellXfs count="2"><xf numFmtId="0"/><xf numFmtId="14"/></cellXfs></styleSheet>'
+    ).format(MAIN_NS)
+
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr('xl/workbook.xml', workbook)
+        archive.writestr('xl/_rels/workbook.xml.rels', relationships)
+        archive.writestr('xl/styles.xml', styles)
+        for index in range(sheets):
+            archive.writestr(
+                'xl/worksheets/sheet{}.xml'.format(index + 1),
+                make_sheet(rows, sheet_columns, error_rate, rand)
+            )
+
+    return buffer.getvalue()
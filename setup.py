@@ -10,6 +10,9 @@ setup(
         'xlrd>=1.1.0',
         'python-dateutil>=2.6.1',
     ],
+    extras_require={
+        'numpy': ['numpy'],
+    },
     tests_require=[
         'coverage',
         'coveralls',
@@ -0,0 +1,150 @@
+import os
+import pickle
+import hashlib
+import tempfile
+import functools
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from sw_excel_parser import __version__
+
+
+def describe(value: Any) -> Any:
+    if isinstance(value, type):
+        return '{}.{}'.format(value.__module__, value.__qualname__)
+    elif hasattr(value, '__code__'):
+        return [value.__module__, value.__qualname__, value.__code__.co_code.hex(), repr(value.__code__.co_consts)]
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        return [describe(item) for item in value]
+    elif isinstance(value, dict):
+        return sorted((str(key), describe(item)) for key, item in value.items())
+    elif hasattr(value, '__dict__'):
+        return [describe(type(value)), describe(vars(value))]
+
+    return repr(value)
+
+
+@functools.lru_cache(maxsize=None)
+def get_fingerprint(engine_class: type) -> str:
+    item_class = engine_class.item
+    cleaners = [
+        (name, describe(value))
+        for klass in reversed(item_class.__mro__)
+        for name, value in vars(klass).items()
+        if name.startswith('clean_') and callable(value)
+    ]
+    description = [
+        __version__,
+        [describe(klass) for klass in engine_class.__mro__],
+        [describe(klass) for klass in item_class.__mro__],
+        describe(item_class._unbound_fields),
+        cleaners
+    ]
+
+    return hashlib.sha256(repr(description).encode()).hexdigest()
+
+
+def get_cache_key(file_contents: bytes, engine_class: type) -> str:
+    key = hashlib.sha256(get_fingerprint(engine_class).encode())
+    key.update(file_contents)
+
+    return key.hexdigest()
+
+
+class BaseCache:
+    def get(self, key: str) -> Optional[Dict]:
+        raise NotImplementedError
+
+    def set(self, key: str, value: Dict) -> None:
+        raise NotImplementedError
+
+
+class MemoryCache(BaseCache):
+    def __init__(self, max_size: int = 64 * 1024 * 1024):
+        self.max_size = max_size
+        self.size = 0
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Dict]:
+        with self.lock:
+            data = self.entries.get(key)
+            if data is None:
+                return None
+            self.entries.move_to_end(key)
+
+        return pickle.loads(data)
+
+    def set(self, key: str, value: Dict) -> None:
+        data = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        if len(data) > self.max_size:
+            return
+
+        with self.lock:
+            if key in self.entries:
+                self.size -= len(self.entries.pop(key))
+
+            self.entries[key] = data
+            self.size += len(data)
+            while self.size > self.max_size:
+                evicted_key, evicted_data = self.entries.popitem(last=False)
+                self.size -= len(evicted_data)
+
+
+class FileSystemCache(BaseCache):
+    suffix = '.pickle'
+
+    def __init__(self, directory: str, max_size: int = 512 * 1024 * 1024):
+        self.directory = directory
+        self.max_size = max_size
+        os.makedirs(directory, exist_ok=True)
+
+    def get_path(self, key: str) -> str:
+        return os.path.join(self.directory, key + self.suffix)
+
+    def get(self, key: str) -> Optional[Dict]:
+        path = self.get_path(key)
+        try:
+            with open(path, 'rb') as cache_file:
+                value = pickle.load(cache_file)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        return value
+
+    def set(self, key: str, value: Dict) -> None:
+        data = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        if len(data) > self.max_size:
+            return
+
+        descriptor, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(descriptor, 'wb') as cache_file:
+            cache_file.write(data)
+        os.replace(temp_path, self.get_path(key))
+
+        self.evict()
+
+    def evict(self) -> None:
+        entries = []
+        with os.scandir(self.directory) as directory_entries:
+            for entry in directory_entries:
+                if entry.name.endswith(self.suffix):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+
+        size = sum(file_size for mtime, file_size, path in entries)
+        for mtime, file_size, path in sorted(entries):
+            if size <= self.max_size:
+                break
+
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            size -= file_size
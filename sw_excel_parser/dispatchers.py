@@ -0,0 +1,83 @@
+from collections import OrderedDict, namedtuple
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional
+
+from sw_excel_parser import readers
+
+Match = namedtuple('Match', ['parser_class', 'header_nrow', 'coverage'])
+
+
+class Dispatcher:
+    max_header_scan_rows = 100
+
+    def __init__(self, parser_classes: Iterable[type] = (), max_header_scan_rows: int = None):
+        if max_header_scan_rows is not None:
+            self.max_header_scan_rows = max_header_scan_rows
+
+        self.parser_classes = []
+        self.headers = {}
+        self.index = {}
+        for parser_class in parser_classes:
+            self.register(parser_class)
+
+    @staticmethod
+    def get_headers(parser_class: type) -> FrozenSet[str]:
+        return frozenset(field.kwargs['header'].lower() for field in parser_class._unbound_fields.values())
+
+    def register(self, parser_class: type) -> type:
+        if parser_class in self.headers:
+            return parser_class
+
+        headers = self.get_headers(parser_class)
+        self.parser_classes.append(parser_class)
+        self.headers[parser_class] = headers
+        for header in headers:
+            self.index.setdefault(header, []).append(parser_class)
+
+        return parser_class
+
+    def match_row(self, row_values: List) -> Dict[type, float]:
+        row_headers = {str(value).lower().strip() for value in row_values}
+        row_headers.discard('')
+
+        counts = {}
+        for header in row_headers:
+            for parser_class in self.index.get(header, ()):
+                counts[parser_class] = counts.get(parser_class, 0) + 1
+
+        return {
+            parser_class: count / len(row_headers)
+            for parser_class, count in counts.items()
+            if count == len(self.headers[parser_class])
+        }
+
+    def scan(self, workbook: Any = None, file_contents: bytes = None, **kwargs) -> Dict[Any, List[Match]]:
+        reader = readers.open_reader(workbook, file_contents, kwargs.pop('reader_class', None), **kwargs)
+        if reader is None:
+            raise ValueError('You must provide workbook or file_contents')
+
+        order = {parser_class: position for position, parser_class in enumerate(self.parser_classes)}
+        result = OrderedDict()
+        for sheet in reader.get_sheets():
+            matches = OrderedDict()
+            for nrow, row_values in reader.iter_rows(sheet, stop=self.max_header_scan_rows):
+                for parser_class, coverage in self.match_row(row_values).items():
+                    if parser_class not in matches:
+                        matches[parser_class] = Match(parser_class, nrow, coverage)
+
+                if len(matches) == len(self.parser_classes):
+                    break
+
+            result[sheet] = sorted(
+                matches.values(),
+                key=lambda match: (-match.coverage, order[match.parser_class])
+            )
+
+        return result
+
+    def get_parser_class(self, workbook: Any = None, file_contents: bytes = None, **kwargs) -> Optional[type]:
+        best_match = None
+        for matches in self.scan(workbook, file_contents, **kwargs).values():
+            if matches and (best_match is None or matches[0].coverage > best_match.coverage):
+                best_match = matches[0]
+
+        return best_match.parser_class if best_match else None
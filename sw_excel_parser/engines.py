@@ -1,16 +1,115 @@
-from collections import OrderedDict
-from itertools import chain
-from typing import List, Dict, Optional, Set
+import os
+import pickle
+import asyncio
+import hashlib
+import tempfile
+import threading
+from collections import OrderedDict, deque
+from concurrent import futures
+from contextlib import closing
+from itertools import islice
+from operator import itemgetter
+from typing import Any, AsyncIterator, Callable, Iterable, Iterator, List, Dict, Optional, Set, Tuple, Union
 
 import xlrd
 from xlrd.sheet import Sheet
 
+from sw_excel_parser import cache
+from sw_excel_parser import readers
+from sw_excel_parser import instrumentation
+
+
+def make_items(item_class: type, rows: List[Tuple[int, Tuple]], columnar: bool = False, lazy: bool = False) -> List:
+    return item_class.from_rows(rows, columnar=columnar, lazy=lazy)
+
+
+def make_row_extractor(column_map: Tuple[Optional[int], ...]) -> Callable[[List], Tuple]:
+    if not column_map:
+        return lambda row_values: ()
+
+    def extract_values(row_values: List) -> Tuple:
+        return tuple(
+            row_values[index] if index is not None and index < len(row_values) else None
+            for index in column_map
+        )
+
+    if None in column_map:
+        return extract_values
+
+    getter = itemgetter(*column_map)
+    width = max(column_map) + 1
+    single = len(column_map) == 1
+
+    def extract_fast(row_values: List) -> Tuple:
+        if len(row_values) < width:
+            return extract_values(row_values)
+
+        values = getter(row_values)
+        return (values,) if single else values
+
+    return extract_fast
+
 
 class BaseEngine:
     item = None
-
-    def __init__(self, workbook: xlrd.Book = None,  file_contents: bytes = None, *args, **kwargs):
+    reader_class = None
+    on_demand = False
+    max_header_scan_rows = None
+    workers = None
+    executor = 'process'
+    chunk_size = 1000
+    columnar = False
+    lazy = False
+    max_errors = None
+    max_error_rate = None
+    error_rate_min_rows = 100
+    cache = None
+    lazy_open = False
+    semaphore = None
+    checkpoint_path = None
+    incremental = False
+    executor_classes = dict(
+        process=futures.ProcessPoolExecutor,
+        thread=futures.ThreadPoolExecutor
+    )
+
+    def __init__(self, workbook: Any = None, file_contents: Union[bytes, memoryview] = None, *args, **kwargs):
         self.workbook = None
+        self.reader = None
+        self.header_map = None
+        self.instrumentation = None
+        self.timings = None
+        if kwargs.get('instrument') or kwargs.get('callbacks'):
+            self.instrumentation = instrumentation.Instrumentation(callbacks=kwargs.get('callbacks'))
+            self.timings = self.instrumentation.timings
+
+        self.reader_class = kwargs.get('reader_class', self.reader_class)
+        self.on_demand = kwargs.get('on_demand', self.on_demand)
+        self.max_header_scan_rows = kwargs.get('max_header_scan_rows', self.max_header_scan_rows)
+        self.workers = kwargs.get('workers', self.workers)
+        self.executor = kwargs.get('executor', self.executor)
+        self.chunk_size = kwargs.get('chunk_size', self.chunk_size)
+        self.columnar = kwargs.get('columnar', self.columnar)
+        self.lazy = kwargs.get('lazy', self.lazy)
+        self.max_errors = kwargs.get('max_errors', self.max_errors)
+        self.max_error_rate = kwargs.get('max_error_rate', self.max_error_rate)
+        self.error_rate_min_rows = kwargs.get('error_rate_min_rows', self.error_rate_min_rows)
+        self.cache = kwargs.get('cache', self.cache)
+        self.lazy_open = kwargs.get('lazy_open', self.lazy_open)
+        self.semaphore = kwargs.get('semaphore', self.semaphore)
+        self.checkpoint_path = kwargs.get('checkpoint_path', self.checkpoint_path)
+        self.resume_position = None
+        self.incremental = kwargs.get('incremental', self.incremental)
+        self.previous_manifest = None
+        self.manifest = None
+        self.changes = None
+        self.validated_count = 0
+        self.cached_data = None
+        self.batch_contexts = {}
+        self.loop = None
+        self.partial = False
+        self.checked_count = 0
+        self.invalid_count = 0
         self.set_workbook(workbook, file_contents)
         self.sheet_items = OrderedDict()
 
@@ -26,27 +125,74 @@ class BaseEngine:
     def values(self):
         return self.sheet_items.values()
 
-    def set_workbook(self, workbook: xlrd.Book = None, file_contents: bytes = None):
-        if file_contents:
-            self.workbook = xlrd.open_workbook(file_contents=file_contents)
-        elif workbook:
-            self.workbook = workbook
+    def measure(self, phase: str):
+        if self.instrumentation is None:
+            return instrumentation.null_measure()
+
+        return self.instrumentation.measure(phase)
+
+    def get_item_class(self) -> type:
+        if self.instrumentation is None or (self.workers and self.executor == 'process'):
+            return self.item
+
+        return self.instrumentation.get_item_class(self.item)
+
+    def set_workbook(self, workbook: Any = None, file_contents: Union[bytes, memoryview] = None):
+        file_name = None
+        if not isinstance(workbook, readers.BaseReader):
+            workbook, file_contents, file_name = readers.resolve_source(workbook, file_contents)
 
-    def get_sheets(self) -> List[Sheet]:
-        if not self.workbook:
+        self.file_name = file_name
+        self.file_contents = file_contents or None
+        self.reader = None
+        self.workbook = None
+        self.cache_key = None
+        if file_contents and (self.lazy_open or self.cache is not None):
+            if self.cache is not None:
+                self.cache_key = cache.get_cache_key(file_contents, type(self))
+        else:
+            self.open_workbook(workbook, file_contents)
+
+        self.header_map = None
+
+    def open_workbook(self, workbook: Any = None, file_contents: bytes = None):
+        with self.measure('open'):
+            self.reader = readers.open_reader(
+                workbook,
+                file_contents,
+                self.reader_class,
+                on_demand=self.on_demand,
+                file_name=self.file_name
+            )
+
+        if self.reader:
+            self.workbook = self.reader.workbook
+
+    def get_sheets(self) -> Iterable[Sheet]:
+        if not self.reader and self.file_contents:
+            self.open_workbook(file_contents=self.file_contents)
+
+        if not self.reader:
             raise ValueError('You must provide workbook or file_contents')
 
-        return self.workbook.sheets()
+        return self.reader.get_sheets()
 
     def find_headers(self) -> Dict[Sheet, Optional[int]]:
+        if self.header_map is None:
+            with self.measure('find_headers'):
+                self.header_map = self.scan_headers()
+
+        return self.header_map
+
+    def scan_headers(self) -> Dict[Sheet, Optional[int]]:
         sheets = self.get_sheets()
         fields = self.item._unbound_fields.values()
         header = {field.kwargs['header'].lower() for field in fields}
 
         result = OrderedDict()
         for sheet in sheets:
-            sheet_data = (sheet.row_values(nrow) for nrow in range(sheet.nrows))
-            for nrow, row_values in enumerate(sheet_data):
+            sheet_data = self.reader.iter_rows(sheet, stop=self.max_header_scan_rows)
+            for nrow, row_values in sheet_data:
                 row_values = {str(field).lower().strip() for field in row_values}
                 if row_values >= header:
                     result[sheet] = nrow
@@ -54,6 +200,9 @@ class BaseEngine:
                 else:
                     self.lost_header_handler(header=header, row_values=row_values)
 
+            if sheet not in result:
+                self.reader.release_sheet(sheet)
+
         return result
 
     def lost_header_handler(self, header, row_values) -> None:
@@ -64,27 +213,495 @@ class BaseEngine:
         header_map = self.find_headers()
         if sheet in header_map:
             header_nrow = header_map[sheet]
-            header = sheet.row_values(header_nrow)
+            header = self.reader.row_values(sheet, header_nrow)
 
         return header
 
-    def prepare_items(self) -> None:
+    def get_column_map(self, sheet: Sheet) -> Tuple[Optional[int], ...]:
+        columns = {}
+        for index, title in enumerate(self.get_header(sheet)):
+            columns[str(title).lower().strip()] = index
+
+        return tuple(columns.get(field.header_key) for name, field, cleaner_name in self.item._field_plan)
+
+    def iter_sheet_rows(self, sheet: Sheet, header_nrow: int, start: int = 0) -> Iterator[Tuple[int, Tuple]]:
+        data_offset = max(header_nrow + 1, start)
+        extract_values = make_row_extractor(self.get_column_map(sheet))
+
+        for nrow, row_values in self.reader.iter_rows(sheet, start=data_offset):
+            yield nrow, extract_values(row_values)
+
+    def iter_rows(self) -> Iterator[Tuple[Sheet, int, Tuple]]:
         header_map = self.find_headers()
+        resume_sheet, resume_nrow = self.resume_position or (None, None)
         for sheet, header_nrow in header_map.items():
-            data_offset = header_nrow + 1
-            sheet_header = list(title.lower().strip() for title in self.get_header(sheet))
-            sheet_data = list(sheet.row_values(nrow) for nrow in range(data_offset, sheet.nrows))
+            start = 0
+            if resume_sheet is not None:
+                if sheet.name != resume_sheet:
+                    continue
+
+                resume_sheet, start = None, resume_nrow + 1
+
+            for nrow, values in self.iter_sheet_rows(sheet, header_nrow, start):
+                yield sheet, nrow, values
+
+    def iter_chunks(self) -> Iterator[List[Tuple[Sheet, int, Tuple]]]:
+        rows = self.iter_rows()
+        chunk = list(islice(rows, self.chunk_size))
+        while chunk:
+            yield chunk
+            chunk = list(islice(rows, self.chunk_size))
+
+    def get_executor(self) -> futures.Executor:
+        if self.executor not in self.executor_classes:
+            raise ValueError('Unknown executor: {}'.format(self.executor))
+
+        return self.executor_classes[self.executor](max_workers=self.workers)
+
+    def build_items(self) -> Iterator[Tuple[Sheet, object]]:
+        items = self.make_items()
+        if self.instrumentation is not None:
+            self.find_headers()
+            items = self.instrumentation.track_items(items)
+
+        return items
+
+    def make_items(self) -> Iterator[Tuple[Sheet, object]]:
+        item_class = self.get_item_class()
+        if self.incremental or (not self.workers and (self.lazy or not self.columnar)):
+            lazy = self.lazy or self.incremental
+            for sheet, nrow, values in self.iter_rows():
+                yield sheet, item_class.from_values(nrow, values, lazy=lazy)
+        elif not self.workers:
+            for chunk in self.iter_chunks():
+                items = make_items(item_class, [(nrow, values) for sheet, nrow, values in chunk], self.columnar)
+                yield from ((sheet, item) for (sheet, nrow, values), item in zip(chunk, items))
+        else:
+            yield from self.make_items_parallel(item_class)
+
+    def make_items_parallel(self, item_class: type) -> Iterator[Tuple[Sheet, object]]:
+        with self.get_executor() as executor:
+            pending = deque()
+            try:
+                for chunk in self.iter_chunks():
+                    rows = [(nrow, values) for sheet, nrow, values in chunk]
+                    pending.append((chunk, executor.submit(make_items, item_class, rows, self.columnar, self.lazy)))
+
+                    while len(pending) > self.workers or (pending and pending[0][1].done()):
+                        chunk, future = pending.popleft()
+                        yield from ((sheet, item) for (sheet, nrow, values), item in zip(chunk, future.result()))
+
+                while pending:
+                    chunk, future = pending.popleft()
+                    yield from ((sheet, item) for (sheet, nrow, values), item in zip(chunk, future.result()))
+            finally:
+                for chunk, future in pending:
+                    future.cancel()
+
+    def prepare_items(self) -> None:
+        for sheet, item in self.build_items():
+            self.sheet_items.setdefault(sheet, []).append(item)
+
+    def iter_items(
+        self,
+        resume_from: str = None,
+        manifest: Dict = None,
+        lazy_window: int = None
+    ) -> Iterator[Tuple[Sheet, object]]:
+        self.reset()
+        if manifest is not None:
+            self.incremental = True
+            self.previous_manifest = manifest
+        if self.incremental:
+            self.manifest = dict(fingerprint=cache.get_fingerprint(type(self)), rows=OrderedDict(), results={})
+        if resume_from is not None:
+            self.load_checkpoint(resume_from)
+        if self.lazy and (self.checkpoint_path or self.resume_position):
+            raise ValueError('Checkpoints are not supported in lazy mode')
+
+        if self.resume_position is not None and self.resume_position[0] is None:
+            return
+
+        handled_count = 0
+        with closing(self.build_items()) as items:
+            if self.incremental:
+                items = self.iter_incremental(items)
+
+            for sheet, item in self.run_batch_validators(items):
+                if self.lazy:
+                    self.handle_lazy_items(lazy_window or self.chunk_size)
+                    self.lazy_items.append((sheet, item))
+                else:
+                    self.handle_item(sheet, item)
+                if self.is_error_budget_exceeded(item):
+                    self.mark_partial()
+
+                yield sheet, item
+
+                if self.partial:
+                    break
+
+                handled_count += 1
+                if self.checkpoint_path and handled_count % self.chunk_size == 0:
+                    self.save_checkpoint(sheet.name, item.nrow)
+
+        if self.lazy:
+            self.handle_lazy_items(lazy_window or self.chunk_size)
+        if self.checkpoint_path and not self.partial:
+            self.save_checkpoint(None, None)
+
+    def handle_lazy_items(self, lazy_window: int = None) -> None:
+        lazy_items = self.lazy_items
+        while lazy_items and (
+            lazy_items[0][1].is_validated()
+            or (lazy_window is not None and len(lazy_items) > lazy_window)
+        ):
+            sheet, item = lazy_items.popleft()
+            if item.is_validated():
+                self.handle_item(sheet, item)
+
+    def get_checkpoint_key(self) -> str:
+        if self.file_contents:
+            return cache.get_cache_key(self.file_contents, type(self))
+
+        return cache.get_fingerprint(type(self))
+
+    def save_checkpoint(self, sheet_name: Optional[str], nrow: Optional[int]) -> None:
+        checkpoint = dict(
+            key=self.get_checkpoint_key(),
+            sheet=sheet_name,
+            nrow=nrow,
+            state=self.dump_state()
+        )
+
+        directory = os.path.dirname(os.path.abspath(self.checkpoint_path))
+        descriptor, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        with os.fdopen(descriptor, 'wb') as checkpoint_file:
+            pickle.dump(checkpoint, checkpoint_file, pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, self.checkpoint_path)
+
+    def load_checkpoint(self, path: str) -> None:
+        if not os.path.exists(path):
+            return
+
+        with open(path, 'rb') as checkpoint_file:
+            checkpoint = pickle.load(checkpoint_file)
+
+        if checkpoint['key'] != self.get_checkpoint_key():
+            raise ValueError('Checkpoint does not match the workbook or the parser')
+
+        self.resume_position = (checkpoint['sheet'], checkpoint['nrow'])
+        self.load_state(checkpoint['state'])
+
+    def dump_state(self) -> Dict:
+        return dict(
+            checked_count=self.checked_count,
+            invalid_count=self.invalid_count,
+            batch_contexts=self.batch_contexts
+        )
+
+    def load_state(self, state: Dict) -> None:
+        self.checked_count = state['checked_count']
+        self.invalid_count = state['invalid_count']
+        self.batch_contexts = state['batch_contexts']
+
+    @staticmethod
+    def get_row_digest(values: Tuple, order: Tuple[int, ...]) -> bytes:
+        return hashlib.blake2b(repr([values[index] for index in order]).encode(), digest_size=16).digest()
+
+    def iter_incremental(self, items: Iterator[Tuple[Sheet, object]]) -> Iterator[Tuple[Sheet, object]]:
+        previous = self.previous_manifest
+        previous_results = {}
+        if previous is not None and previous['fingerprint'] == self.manifest['fingerprint']:
+            previous_results = previous['results']
+
+        field_plan = self.item._field_plan
+        order = tuple(sorted(range(len(field_plan)), key=lambda index: field_plan[index][1].header_key))
+        rows, results = self.manifest['rows'], self.manifest['results']
+        for sheet, item in items:
+            digest = self.get_row_digest(item.values, order)
+            rows[(sheet.name, item.nrow)] = digest
+
+            result = results.get(digest) or previous_results.get(digest)
+            if result is None:
+                item.validate()
+                self.validated_count += 1
+                result = (item.cleaned_values, item.errors or None)
+            else:
+                item.set_result(*result)
+
+            results[digest] = result
+            yield sheet, item
+
+        if previous is not None:
+            self.changes = self.diff_manifest(previous['rows'], rows)
+
+    @staticmethod
+    def diff_manifest(previous_rows: Dict, rows: Dict) -> Dict[str, List[Tuple[str, int]]]:
+        return dict(
+            inserted=[position for position in rows if position not in previous_rows],
+            updated=[
+                position for position, digest in rows.items()
+                if position in previous_rows and previous_rows[position] != digest
+            ],
+            deleted=[position for position in previous_rows if position not in rows]
+        )
+
+    def get_categories(self) -> Dict[str, List[str]]:
+        return OrderedDict(
+            (name, field.get_categories())
+            for name, field, cleaner_name in self.item._field_plan
+            if getattr(field, 'categorical', False)
+        )
+
+    def get_manifest(self) -> Optional[Dict]:
+        return self.manifest
+
+    def run_batch_validators(self, items: Iterator[Tuple[Sheet, object]]) -> Iterator[Tuple[Sheet, object]]:
+        if not any(field.batch_validators for name, field, cleaner_name in self.item._field_plan):
+            return items
+
+        return self.iter_batch_validated(items)
+
+    def iter_batch_validated(self, items: Iterator[Tuple[Sheet, object]]) -> Iterator[Tuple[Sheet, object]]:
+        chunk_sheet, chunk = None, []
+        for sheet, item in items:
+            if chunk and (sheet is not chunk_sheet or len(chunk) >= self.chunk_size):
+                self.validate_batch(chunk)
+                yield from ((chunk_sheet, chunk_item) for chunk_item in chunk)
+                chunk = []
+
+            chunk_sheet = sheet
+            chunk.append(item)
+
+        if chunk:
+            self.validate_batch(chunk)
+            yield from ((chunk_sheet, chunk_item) for chunk_item in chunk)
+
+    def validate_batch(self, chunk: List) -> None:
+        for index, (name, field, cleaner_name) in enumerate(self.item._field_plan):
+            for validator_index, validator in enumerate(field.batch_validators):
+                candidates = [item for item in chunk if name not in item.errors]
+                if not candidates:
+                    break
+
+                errors = self.run_batch_validator(
+                    validator,
+                    field,
+                    [item.nrow for item in candidates],
+                    [item.cleaned_values[index] for item in candidates],
+                    self.batch_contexts.setdefault((name, validator_index), {})
+                )
+                if errors:
+                    for item in candidates:
+                        if item.nrow in errors:
+                            item.add_error(name, errors[item.nrow])
+
+    def run_batch_validator(self, validator, field, nrows: List[int], values: List, context: Dict) -> Dict:
+        if not asyncio.iscoroutinefunction(validator.validate_batch):
+            return validator.validate_batch(field, nrows, values, context)
+
+        coroutine = validator.validate_batch(field, nrows, values, context)
+        if self.loop is not None:
+            return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result()
+
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(coroutine)
+        finally:
+            loop.close()
+
+    def is_error_budget_exceeded(self, item) -> bool:
+        if self.max_errors is None and self.max_error_rate is None:
+            return False
+
+        self.checked_count += 1
+        if not item.is_valid():
+            self.invalid_count += 1
+
+        if self.max_errors is not None and self.invalid_count > self.max_errors:
+            return True
+
+        return (
+            self.max_error_rate is not None
+            and self.checked_count >= self.error_rate_min_rows
+            and self.invalid_count / self.checked_count > self.max_error_rate
+        )
+
+    def mark_partial(self) -> None:
+        self.partial = True
+
+    def iter_batches(self, batch_size: int) -> Iterator[Tuple[Sheet, List]]:
+        batch_sheet, batch = None, []
+        for sheet, item in self.iter_items(lazy_window=batch_size):
+            if batch and (sheet is not batch_sheet or len(batch) >= batch_size):
+                yield batch_sheet, batch
+                batch = []
+
+            batch_sheet = sheet
+            batch.append(item)
+
+        if batch:
+            yield batch_sheet, batch
+
+    def export(self, valid_sink=None, invalid_sink=None, batch_size: int = None) -> None:
+        names = tuple(self.item._bound_fields)
+        invalid_columns = ('sheet', 'nrow') + names + ('errors',)
+
+        for sheet, batch in self.iter_batches(batch_size or self.chunk_size):
+            valid_rows, invalid_rows = [], []
+            for item in batch:
+                if item.is_valid():
+                    valid_rows.append(item.cleaned_values)
+                else:
+                    invalid_rows.append(self.get_invalid_row(sheet, item))
+
+            if valid_rows and valid_sink is not None:
+                valid_sink.write(sheet.name, names, valid_rows)
+            if invalid_rows and invalid_sink is not None:
+                invalid_sink.write(sheet.name, invalid_columns, invalid_rows)
 
-            if sheet_data:
-                self.sheet_items[sheet] = []
+        if self.lazy:
+            self.handle_lazy_items()
 
-            for nrow, row_data in enumerate(sheet_data, start=data_offset):
-                item = self.item(nrow, dict(zip(sheet_header, row_data)))
-                self.sheet_items[sheet].append(item)
+    def get_invalid_row(self, sheet: Sheet, item) -> Tuple:
+        errors = '; '.join(
+            '{}: {}'.format(item.fields[name].header, error)
+            for name, error in item.errors.items()
+        )
+
+        return (sheet.name, item.nrow) + item.values + (errors,)
+
+    def preview(self, rows: int = 50) -> Dict[Sheet, List]:
+        preview_items = OrderedDict()
+        self.batch_contexts = {}
+        with closing(self.build_items()) as items:
+            for sheet, item in self.run_batch_validators(islice(items, rows)):
+                item.is_valid()
+                preview_items.setdefault(sheet, []).append(item)
 
-    def parse(self) -> None:
+        return preview_items
+
+    def reset(self) -> None:
         self.sheet_items.clear()
-        self.prepare_items()
+        self.lazy_items = deque()
+        self.cached_data = None
+        self.batch_contexts = {}
+        self.resume_position = None
+        self.previous_manifest = None
+        self.manifest = None
+        self.changes = None
+        self.validated_count = 0
+        self.partial = False
+        self.checked_count = 0
+        self.invalid_count = 0
+
+    def handle_item(self, sheet: Sheet, item) -> None:
+        pass
+
+    def reset_results(self) -> None:
+        self.lazy_items.clear()
+
+    def set_parse_options(self, workers: int = None, executor: str = None) -> None:
+        if workers is not None:
+            self.workers = workers
+        if executor is not None:
+            self.executor = executor
+
+    def parse(self, workers: int = None, executor: str = None, resume_from: str = None, manifest: Dict = None) -> None:
+        self.set_parse_options(workers, executor)
+
+        if self.load_cached_result():
+            return
+
+        for sheet, item in self.iter_items(resume_from, manifest):
+            self.sheet_items.setdefault(sheet, []).append(item)
+
+        if self.lazy:
+            self.reset_results()
+
+        self.store_cached_result()
+
+    def get_semaphore(self) -> asyncio.Semaphore:
+        if self.semaphore is None:
+            return asyncio.Semaphore()
+
+        return self.semaphore
+
+    async def aparse(self, workers: int = None, executor: str = None, chunk_size: int = None) -> None:
+        self.set_parse_options(workers, executor)
+        loop = asyncio.get_event_loop()
+
+        async with self.get_semaphore():
+            if await loop.run_in_executor(None, self.load_cached_result):
+                return
+
+            async for sheet, item in self.astream_items(chunk_size):
+                self.sheet_items.setdefault(sheet, []).append(item)
+
+            if self.lazy:
+                self.reset_results()
+
+            await loop.run_in_executor(None, self.store_cached_result)
+
+    async def astream(self, chunk_size: int = None) -> AsyncIterator[Tuple[Sheet, object]]:
+        async with self.get_semaphore():
+            async for sheet, item in self.astream_items(chunk_size):
+                yield sheet, item
+
+    async def astream_items(self, chunk_size: int = None) -> AsyncIterator[Tuple[Sheet, object]]:
+        loop = asyncio.get_event_loop()
+        chunk_size = chunk_size or self.chunk_size
+        items = self.iter_items(lazy_window=chunk_size)
+        self.loop = loop
+        cancelled = threading.Event()
+        thread = futures.ThreadPoolExecutor(max_workers=1)
+
+        def next_chunk() -> List[Tuple[Sheet, object]]:
+            chunk = []
+            for pair in items:
+                chunk.append(pair)
+                if len(chunk) >= chunk_size or cancelled.is_set():
+                    break
+
+            return chunk
+
+        try:
+            while True:
+                chunk = await loop.run_in_executor(thread, next_chunk)
+                if not chunk:
+                    break
+
+                for sheet, item in chunk:
+                    yield sheet, item
+        finally:
+            cancelled.set()
+            thread.submit(items.close)
+            thread.shutdown(wait=False)
+            self.loop = None
+
+    def load_cached_result(self) -> bool:
+        if self.cache_key is None:
+            return False
+
+        result = self.cache.get(self.cache_key)
+        if result is None:
+            return False
+
+        self.reset()
+        self.load_result(result)
+
+        return True
+
+    def store_cached_result(self) -> None:
+        if self.cache_key is not None and not self.partial and self.resume_position is None:
+            self.cache.set(self.cache_key, self.dump_result())
+
+    def dump_result(self) -> Dict:
+        return dict(cleaned_data=self.get_cleaned_data())
+
+    def load_result(self, result: Dict) -> None:
+        self.cached_data = result['cleaned_data']
 
     def is_recognized(self) -> bool:
         headers_nrows = self.find_headers().values()
@@ -92,13 +709,17 @@ class BaseEngine:
         return any(nrow is not None for nrow in headers_nrows)
 
     def get_cleaned_data(self):
+        if self.cached_data is not None:
+            return self.cached_data
+
         cleaned_data = OrderedDict()
 
         for sheet, items in self.items():
             sheet_data = []
             for item in items:
-                if item.cleaned_data:
-                    sheet_data.append(item.cleaned_data)
+                item_cleaned_data = item.cleaned_data
+                if item_cleaned_data:
+                    sheet_data.append(item_cleaned_data)
 
             cleaned_data[sheet.name] = sheet_data
 
@@ -110,26 +731,79 @@ class StatsMixin:
         super(StatsMixin, self).__init__(*args, **kwargs)
         self.stats = {}
 
-    def parse(self) -> None:
-        self.stats.clear()
+    @property
+    def stats(self) -> Dict:
+        if self._stats is None:
+            self.compute_stats()
 
-        super().parse()
-        self.compute_stats()
+        return self._stats
 
-    def compute_stats(self) -> None:
-        items = list(chain.from_iterable(self.sheet_items.values()))
+    @stats.setter
+    def stats(self, value: Dict) -> None:
+        self._stats = value
 
-        success_count = len([item for item in items if item.is_valid()])
-        errors_count = len(items) - success_count
-        erroneous_sheets = [sheet.name for sheet, items in self if any(not item.is_valid() for item in items)]
+    def reset(self) -> None:
+        super().reset()
+        self.reset_stats()
 
+    def reset_stats(self) -> None:
         self.stats = dict(
-            total_count=len(items),
-            success_count=success_count,
-            errors_count=errors_count,
-            erroneous_sheets=erroneous_sheets
+            total_count=0,
+            success_count=0,
+            errors_count=0,
+            erroneous_sheets=[],
+            partial=self.partial
         )
 
+    def handle_item(self, sheet: Sheet, item) -> None:
+        super().handle_item(sheet, item)
+        self.count_item(sheet, item)
+
+    def reset_results(self) -> None:
+        super().reset_results()
+        self.stats = None
+
+    def mark_partial(self) -> None:
+        super().mark_partial()
+        if self._stats is not None:
+            self.stats['partial'] = True
+
+    def dump_result(self) -> Dict:
+        result = super().dump_result()
+        result['stats'] = self.stats
+
+        return result
+
+    def load_result(self, result: Dict) -> None:
+        super().load_result(result)
+        self.stats = result['stats']
+
+    def dump_state(self) -> Dict:
+        state = super().dump_state()
+        state['stats'] = self.stats
+
+        return state
+
+    def load_state(self, state: Dict) -> None:
+        super().load_state(state)
+        self.stats = state['stats']
+
+    def count_item(self, sheet: Sheet, item) -> None:
+        self.stats['total_count'] += 1
+        if item.is_valid():
+            self.stats['success_count'] += 1
+        else:
+            self.stats['errors_count'] += 1
+            erroneous_sheets = self.stats['erroneous_sheets']
+            if not erroneous_sheets or erroneous_sheets[-1] != sheet.name:
+                erroneous_sheets.append(sheet.name)
+
+    def compute_stats(self) -> None:
+        self.reset_stats()
+        for sheet, items in self:
+            for item in items:
+                self.count_item(sheet, item)
+
 
 class ErrorsMixin:
     def __init__(self, *args, **kwargs):
@@ -137,43 +811,96 @@ class ErrorsMixin:
         self.lost_headers = set()
         self.errors = {}
 
-    def parse(self) -> None:
+    @property
+    def errors(self) -> Dict:
+        if self._errors is None:
+            self.collect_errors()
+
+        return self._errors
+
+    @errors.setter
+    def errors(self, value: Dict) -> None:
+        self._errors = value
+
+    def scan_headers(self) -> Dict[Sheet, Optional[int]]:
         self.lost_headers.clear()
-        self.errors.clear()
 
-        super().parse()
-        self.collect_errors()
+        return super().scan_headers()
 
     def lost_header_handler(self, header: Set[str], row_values: Set[str]) -> None:
         if header & row_values:
             self.lost_headers.update(header - row_values)
 
-    def collect_errors(self) -> None:
-        items = list(chain.from_iterable(self.values()))
-        erroneous_items = [item for item in items if not item.is_valid()]
+    def reset(self) -> None:
+        super().reset()
+        self.reset_errors()
 
+    def reset_errors(self) -> None:
         self.errors = dict(
             non_field_errors=dict(
-                lost_headers=self.lost_headers
+                lost_headers=self.lost_headers,
+                partial=self.partial
             )
         )
 
-        for item in erroneous_items:
-            for name, field in item.fields.items():
-                if name in item.errors:
-                    if name not in self.errors:
-                        self.errors[name] = dict(
-                            label=field.header,
-                            rows=[]
-                        )
-
-                    self.errors[name]['rows'].append(
-                        dict(
-                            nrow=item.nrow,
-                            value=field.extract_data(item.data),
-                            error=str(item.errors[name])
-                        )
-                    )
+    def handle_item(self, sheet: Sheet, item) -> None:
+        super().handle_item(sheet, item)
+        self.add_item_errors(item)
+
+    def reset_results(self) -> None:
+        super().reset_results()
+        self.errors = None
+
+    def mark_partial(self) -> None:
+        super().mark_partial()
+        if self._errors is not None:
+            self.errors['non_field_errors']['partial'] = True
+
+    def dump_result(self) -> Dict:
+        result = super().dump_result()
+        result['errors'] = self.errors
+
+        return result
+
+    def load_result(self, result: Dict) -> None:
+        super().load_result(result)
+        self.errors = result['errors']
+
+    def dump_state(self) -> Dict:
+        state = super().dump_state()
+        state['errors'] = self.errors
+
+        return state
+
+    def load_state(self, state: Dict) -> None:
+        super().load_state(state)
+        errors = state['errors']
+        self.lost_headers.update(errors['non_field_errors']['lost_headers'])
+        errors['non_field_errors']['lost_headers'] = self.lost_headers
+        self.errors = errors
+
+    def collect_errors(self) -> None:
+        self.reset_errors()
+        for items in self.values():
+            for item in items:
+                self.add_item_errors(item)
+
+    def add_item_errors(self, item) -> None:
+        for name, error in item.errors.items():
+            field = item.fields[name]
+            if name not in self.errors:
+                self.errors[name] = dict(
+                    label=field.header,
+                    rows=[]
+                )
+
+            self.errors[name]['rows'].append(
+                dict(
+                    nrow=item.nrow,
+                    value=field.extract_data(item.data),
+                    error=str(error)
+                )
+            )
 
 
 class Engine(ErrorsMixin, StatsMixin, BaseEngine):
@@ -1,9 +1,17 @@
 import uuid
+import datetime
+import functools
 import itertools
-from typing import Any, Type, List, Dict
+import threading
+from typing import Any, Type, List, Dict, Optional, Tuple
 
 import dateutil.parser
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 from sw_excel_parser import validators
 
 
@@ -12,6 +20,16 @@ class UnboundField:
         self.field_class = field_class
         self.args = args
         self.kwargs = kwargs
+        self.name = None
+
+    def __set_name__(self, owner, name: str):
+        self.name = name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+
+        return owner._bound_fields[self.name]
 
     def bind(self, item, name: str) -> 'Field':
         return self.field_class(*self.args, **dict(self.kwargs, _item=item, name=name))
@@ -26,6 +44,7 @@ class UnboundField:
 
 
 class Field:
+    columnar = False
     default_validators = [
         validators.RequiredValidator()
     ]
@@ -40,9 +59,13 @@ class Field:
 
     def __init__(self, header: str, required: bool = True, validators: List = list(), *args, **kwargs):
         self.header = header
+        self.header_key = header.lower()
         self.required = required
-        self.validators = list(itertools.chain(self.default_validators, validators))
-        self.value = None
+        all_validators = list(itertools.chain(self.default_validators, validators))
+        self.validators = [validator for validator in all_validators if not hasattr(validator, 'validate_batch')]
+        self.batch_validators = [validator for validator in all_validators if hasattr(validator, 'validate_batch')]
+        self.column_validators = list(itertools.takewhile(lambda v: hasattr(v, 'check_column'), self.validators))
+        self.row_validators = self.validators[len(self.column_validators):]
 
         self._item = kwargs.get('_item')
         self.name = kwargs.get('name')
@@ -53,16 +76,68 @@ class Field:
 
         return value
 
+    def run_row_validators(self, value: Any) -> Any:
+        for validator in self.row_validators:
+            value = validator(self, value)
+
+        return value
+
     def to_python(self, value: Any) -> Any:
         return value
 
+    def to_python_array(self, array: 'numpy.ndarray') -> Tuple['numpy.ndarray', 'numpy.ndarray']:
+        raise NotImplementedError
+
+    def clean_column_value(self, value: Any) -> Any:
+        try:
+            value = self.to_python(value)
+            for validator in self.column_validators:
+                value = validator(self, value)
+        except validators.ValidationError as e:
+            value = e
+
+        return value
+
+    def clean_array(self, array: 'numpy.ndarray') -> List:
+        result, errors_mask = self.to_python_array(array)
+
+        for validator in self.column_validators:
+            mask = validator.check_column(self, array)
+            if mask is not None:
+                mask &= ~errors_mask
+                result[mask] = validators.ValidationError(validator.message)
+                errors_mask |= mask
+
+        return result.tolist()
+
+    def clean_column(self, values: List) -> List:
+        if numpy is None or not self.columnar:
+            return [self.clean_column_value(value) for value in values]
+
+        result = []
+        array_indexes = []
+        for index, value in enumerate(values):
+            if type(value) is float:
+                array_indexes.append(index)
+                result.append(None)
+            else:
+                result.append(self.clean_column_value(value))
+
+        if array_indexes:
+            array = numpy.array([values[index] for index in array_indexes], dtype=float)
+            for index, value in zip(array_indexes, self.clean_array(array)):
+                result[index] = value
+
+        return result
+
     def extract_data(self, data: Dict) -> Any:
-        return data.get(self.header.lower())
+        return data.get(self.header_key)
+
+    def clean_value(self, value: Any) -> Any:
+        return self.run_validators(self.to_python(value))
 
     def clean(self, data: Dict) -> Any:
-        self.value = self.extract_data(data)
-        val = self.to_python(self.value)
-        return self.run_validators(val)
+        return self.clean_value(self.extract_data(data))
 
 
 class BooleanField(Field):
@@ -82,29 +157,81 @@ class BooleanField(Field):
 
 
 class CharField(Field):
+    max_categories = 4096
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.categorical = kwargs.get('categorical', False)
+        self.max_categories = kwargs.get('max_categories', self.max_categories)
+        self.categories = {}
+        self.codes = {}
+        self.lock = threading.Lock()
+
     def to_python(self, value: Any):
+        if self.categorical and type(value) is str:
+            category = self.categories.get(value)
+            if category is not None:
+                return category
+
+            return self.add_category(value)
+
         if value:
             value = str(value).strip()
 
         return value
 
+    def add_category(self, raw_value: str) -> str:
+        value = raw_value.strip()
+        if len(self.categories) >= self.max_categories:
+            return value
+
+        with self.lock:
+            value = self.categories.setdefault(value, value)
+            self.categories[raw_value] = value
+            if value and value not in self.codes:
+                self.codes[value] = len(self.codes)
+
+        return value
+
+    def get_categories(self) -> List[str]:
+        return sorted(self.codes, key=self.codes.get)
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_date(value: Any, dayfirst: bool = False, formats: Tuple[str, ...] = ()) -> Optional[datetime.date]:
+    for date_format in formats:
+        try:
+            return datetime.datetime.strptime(value.strip(), date_format).date()
+        except (ValueError, AttributeError):
+            pass
+
+    try:
+        return dateutil.parser.parse(value, dayfirst=dayfirst).date()
+    except (ValueError, OverflowError, TypeError):
+        return None
+
 
 class DateField(Field):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.dayfirst = kwargs.get('dayfirst', False)
+        self.formats = tuple(kwargs.get('formats', ()))
 
     def to_python(self, value: Any):
-        if value:
-            try:
-                value = dateutil.parser.parse(value, dayfirst=self.dayfirst).date()
-            except (ValueError, OverflowError):
+        if isinstance(value, datetime.datetime):
+            value = value.date()
+        elif isinstance(value, datetime.date):
+            pass
+        elif value:
+            value = parse_date(value, self.dayfirst, self.formats)
+            if value is None:
                 raise validators.ValidationError('Некорректное значение.')
 
         return value
 
 
 class BaseNumericField(Field):
+    columnar = True
     default_validators = [
         validators.RequiredValidator(),
         validators.MinValueValidator(),
@@ -127,6 +254,9 @@ class FloatField(BaseNumericField):
 
         return value
 
+    def to_python_array(self, array: 'numpy.ndarray') -> Tuple['numpy.ndarray', 'numpy.ndarray']:
+        return array.astype(object), numpy.zeros(len(array), dtype=bool)
+
 
 class IntegerField(BaseNumericField):
     def to_python(self, value: Any) -> int:
@@ -142,6 +272,21 @@ class IntegerField(BaseNumericField):
 
         return value
 
+    def to_python_array(self, array: 'numpy.ndarray') -> Tuple['numpy.ndarray', 'numpy.ndarray']:
+        result = array.astype(object)
+        nonzero = array != 0
+        integral = numpy.isfinite(array) & (numpy.floor(array) == array)
+
+        convert = nonzero & integral & (numpy.abs(array) < 2 ** 53)
+        result[convert] = array[convert].astype(numpy.int64)
+        for index in numpy.flatnonzero(nonzero & integral & ~convert):
+            result[index] = int(array[index])
+
+        errors_mask = nonzero & ~integral
+        result[errors_mask] = validators.ValidationError('Значение не является целым.')
+
+        return result, errors_mask
+
 
 class EmailField(CharField):
     default_validators = [
@@ -0,0 +1,132 @@
+import sys
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, Tuple
+
+
+@contextmanager
+def null_measure() -> Iterator[None]:
+    yield None
+
+
+class TimedField:
+    def __init__(self, field, record: Dict[str, Any]):
+        self.field = field
+        self.record = record
+
+    def __getattr__(self, name):
+        return getattr(self.field, name)
+
+    def clean_value(self, value: Any) -> Any:
+        started_at = time.perf_counter()
+        try:
+            return self.field.clean_value(value)
+        finally:
+            self.record['seconds'] += time.perf_counter() - started_at
+            self.record['calls'] += 1
+
+    def run_row_validators(self, value: Any) -> Any:
+        started_at = time.perf_counter()
+        try:
+            return self.field.run_row_validators(value)
+        finally:
+            self.record['seconds'] += time.perf_counter() - started_at
+            self.record['calls'] += 1
+
+
+class StatsdCallback:
+    def __init__(self, client, prefix: str = 'sw_excel_parser'):
+        self.client = client
+        self.prefix = prefix
+
+    def __call__(self, phase: str, record: Dict[str, Any]) -> None:
+        self.client.timing('{}.{}'.format(self.prefix, phase), record['seconds'] * 1000)
+        if record.get('rows'):
+            self.client.incr('{}.{}.rows'.format(self.prefix, phase), record['rows'])
+
+
+class Instrumentation:
+    def __init__(self, callbacks: Iterable[Callable[[str, Dict[str, Any]], None]] = None):
+        self.callbacks = list(callbacks or [])
+        self.timings = OrderedDict(
+            phases=OrderedDict(),
+            sheets=OrderedDict(),
+            fields=OrderedDict()
+        )
+        self.item_classes = {}
+
+    @staticmethod
+    def get_record(group: Dict, key: str) -> Dict[str, Any]:
+        if key not in group:
+            group[key] = dict(seconds=0.0, calls=0, rows=0, allocated_blocks=0)
+
+        return group[key]
+
+    def notify(self, phase: str, record: Dict[str, Any]) -> None:
+        for callback in self.callbacks:
+            callback(phase, record)
+
+    @contextmanager
+    def measure(self, phase: str) -> Iterator[Dict[str, Any]]:
+        record = self.get_record(self.timings['phases'], phase)
+        allocated_blocks = sys.getallocatedblocks()
+        started_at = time.perf_counter()
+        try:
+            yield record
+        finally:
+            delta = dict(
+                seconds=time.perf_counter() - started_at,
+                allocated_blocks=sys.getallocatedblocks() - allocated_blocks
+            )
+            record['seconds'] += delta['seconds']
+            record['allocated_blocks'] += delta['allocated_blocks']
+            record['calls'] += 1
+            self.notify(phase, delta)
+
+    def track_items(self, items: Iterator[Tuple[Any, Any]], phase: str = 'build_items') -> Iterator[Tuple[Any, Any]]:
+        phase_record = self.get_record(self.timings['phases'], phase)
+        phase_record['calls'] += 1
+        sheet_delta = None
+
+        while True:
+            allocated_blocks = sys.getallocatedblocks()
+            started_at = time.perf_counter()
+            try:
+                sheet, item = next(items)
+            except StopIteration:
+                break
+            finally:
+                seconds = time.perf_counter() - started_at
+                allocated_blocks = sys.getallocatedblocks() - allocated_blocks
+                phase_record['seconds'] += seconds
+                phase_record['allocated_blocks'] += allocated_blocks
+
+            if sheet_delta is None or sheet_delta['sheet'] != sheet.name:
+                if sheet_delta is not None:
+                    self.notify(phase, sheet_delta)
+                sheet_delta = dict(sheet=sheet.name, seconds=0.0, rows=0, allocated_blocks=0)
+                self.get_record(self.timings['sheets'], sheet.name)['calls'] += 1
+
+            sheet_record = self.get_record(self.timings['sheets'], sheet.name)
+            for record in (phase_record, sheet_record, sheet_delta):
+                record['rows'] += 1
+            for record in (sheet_record, sheet_delta):
+                record['seconds'] += seconds
+                record['allocated_blocks'] += allocated_blocks
+
+            yield sheet, item
+
+        if sheet_delta is not None:
+            self.notify(phase, sheet_delta)
+
+    def get_item_class(self, item_class: type) -> type:
+        if item_class not in self.item_classes:
+            instrumented_class = type(item_class.__name__, (item_class,), dict(__slots__=()))
+            instrumented_class._field_plan = tuple(
+                (name, TimedField(field, self.get_record(self.timings['fields'], name)), cleaner_name)
+                for name, field, cleaner_name in item_class._field_plan
+            )
+            self.item_classes[item_class] = instrumented_class
+
+        return self.item_classes[item_class]
@@ -1,4 +1,4 @@
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Tuple
 from collections import OrderedDict
 
 from sw_excel_parser import fields
@@ -15,40 +15,160 @@ class ItemMeta(type):
                 if isinstance(value, fields.UnboundField):
                     cls._unbound_fields[key] = value
 
+        cls._bound_fields = OrderedDict(
+            (name, unbound_field.bind(item=cls, name=name)) for name, unbound_field in cls._unbound_fields.items()
+        )
+        cls._field_plan = tuple(
+            (name, field, 'clean_{}'.format(name) if hasattr(cls, 'clean_{}'.format(name)) else None)
+            for name, field in cls._bound_fields.items()
+        )
+        cls._field_indexes = {name: index for index, name in enumerate(cls._bound_fields)}
+
+
+class BoundFields:
+    def __get__(self, instance, owner):
+        if instance is None:
+            raise AttributeError('fields')
+
+        return owner._bound_fields
+
 
 class BaseItem:
-    def __init__(self, fields, *args, **kwargs):
-        self.fields = OrderedDict()
-        for name, unbound_field in fields.items():
-            bound_field = unbound_field.bind(item=self, name=name)
-            self.fields[name] = bound_field
-            setattr(self, name, bound_field)
+    __slots__ = ()
+
+    fields = BoundFields()
 
 
 class Item(BaseItem, metaclass=ItemMeta):
-    def __init__(self, nrow: int, data: Dict[str, Any] = None):
-        super().__init__(fields=self._unbound_fields)
+    __slots__ = ('nrow', 'values', '_cleaned_values', '_errors')
+
+    def __init__(self, nrow: int, data: Dict[str, Any] = None, prepared: Dict[str, Any] = None, lazy: bool = False):
+        data = data or {}
         self.nrow = nrow
-        self.data = data or {}
-        self.errors = {}
-        self.cleaned_data = {}
+        self.values = tuple(field.extract_data(data) for name, field, cleaner_name in self._field_plan)
+        self._cleaned_values = None
+        self._errors = None
+
+        if not lazy:
+            self.validate(prepared)
+
+    @classmethod
+    def from_values(cls, nrow: int, values: Tuple, prepared: Dict[str, Any] = None, lazy: bool = False) -> 'Item':
+        item = cls.__new__(cls)
+        item.nrow = nrow
+        item.values = values
+        item._cleaned_values = None
+        item._errors = None
+
+        if not lazy:
+            item.validate(prepared)
+
+        return item
+
+    @classmethod
+    def from_rows(cls, rows: List[Tuple[int, Tuple]], columnar: bool = False, lazy: bool = False) -> List['Item']:
+        if lazy or not columnar:
+            return [cls.from_values(nrow, values, lazy=lazy) for nrow, values in rows]
+
+        columns = {
+            name: field.clean_column([values[index] for nrow, values in rows])
+            for index, (name, field, cleaner_name) in enumerate(cls._field_plan) if field.columnar
+        }
+
+        return [
+            cls.from_values(nrow, values, {name: column[row_index] for name, column in columns.items()})
+            for row_index, (nrow, values) in enumerate(rows)
+        ]
+
+    def __getstate__(self):
+        return self.nrow, self.values, self._cleaned_values, self._errors
+
+    def __setstate__(self, state):
+        self.nrow, self.values, self._cleaned_values, self._errors = state
+
+    def is_validated(self) -> bool:
+        return isinstance(self._cleaned_values, tuple)
 
-        self.validate()
+    @property
+    def cleaned_values(self) -> Tuple:
+        if self._cleaned_values is None:
+            self.validate()
+
+        if isinstance(self._cleaned_values, dict):
+            return tuple(self._cleaned_values.get(name) for name in self._bound_fields)
+
+        return self._cleaned_values
+
+    @property
+    def data(self) -> Dict[str, Any]:
+        return {field.header_key: value for field, value in zip(self._bound_fields.values(), self.values)}
+
+    @property
+    def cleaned_data(self) -> Dict[str, Any]:
+        if isinstance(self._cleaned_values, dict):
+            return dict(self._cleaned_values)
+
+        cleaned_values = self.cleaned_values
+        errors = self._errors or ()
+
+        return {
+            name: value for name, value in zip(self._bound_fields, cleaned_values)
+            if name not in errors
+        }
+
+    @property
+    def errors(self) -> Dict[str, validators.ValidationError]:
+        if self._cleaned_values is None:
+            self.validate()
+
+        return self._errors if self._errors is not None else {}
 
     def is_valid(self) -> bool:
-        return not self.errors
+        if self._cleaned_values is None:
+            self.validate()
 
-    def validate(self) -> None:
-        self.errors.clear()
-        self.cleaned_data.clear()
+        return not self._errors
+
+    def get_code(self, name: str) -> Optional[int]:
+        return self.fields[name].codes.get(self.cleaned_values[self._field_indexes[name]])
+
+    def set_result(self, cleaned_values: Tuple, errors: Dict[str, validators.ValidationError] = None) -> None:
+        self._cleaned_values = cleaned_values
+        self._errors = errors
+
+    def add_error(self, name: str, error: validators.ValidationError) -> None:
+        cleaned_values = list(self.cleaned_values)
+        cleaned_values[self._field_indexes[name]] = None
+
+        self._cleaned_values = tuple(cleaned_values)
+        self._errors = dict(self._errors or {}, **{name: error})
+
+    def validate(self, prepared: Dict[str, Any] = None) -> None:
+        errors = {}
+        cleaned_data = {}
+        self._cleaned_values = cleaned_data
+        self._errors = errors
+
+        for (name, field, cleaner_name), value in zip(self._field_plan, self.values):
+            if prepared and name in prepared:
+                value = prepared[name]
+                if isinstance(value, validators.ValidationError):
+                    errors[name] = value
+                    continue
 
-        for name, field in self.fields.items():
             try:
-                value = field.clean(self.data)
-                field_cleaner = getattr(self, 'clean_{}'.format(name), None)
-                if field_cleaner:
-                    value = field_cleaner(value)
+                if prepared and name in prepared:
+                    value = field.run_row_validators(value)
+                else:
+                    value = field.clean_value(value)
 
-                self.cleaned_data[name] = value
+                if cleaner_name:
+                    value = getattr(self, cleaner_name)(value)
             except validators.ValidationError as e:
-                self.errors[name] = e
+                errors[name] = e
+                continue
+
+            cleaned_data[name] = value
+
+        self._cleaned_values = tuple(cleaned_data.get(name) for name in self._bound_fields)
+        self._errors = errors or None
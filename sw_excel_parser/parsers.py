@@ -9,8 +9,17 @@ class ParserMeta(items.ItemMeta):
         meta_bases = tuple(klass.Meta for klass in cls.mro() if 'Meta' in klass.__dict__)
 
         cls._meta = type('Meta', meta_bases, {})
-        cls.item_class = type('Item', (cls._meta.item_class,), cls._unbound_fields)
-        cls.engine_class = type('Engine', (cls._meta.engine_class,), dict(item=cls.item_class))
+        cls.item_class = type('Item', (cls._meta.item_class,), dict(
+            cls._unbound_fields,
+            __slots__=(),
+            __module__=cls.__module__,
+            __qualname__='{}.item_class'.format(cls.__qualname__)
+        ))
+        cls.engine_class = type('Engine', (cls._meta.engine_class,), dict(
+            item=cls.item_class,
+            __module__=cls.__module__,
+            __qualname__='{}.engine_class'.format(cls.__qualname__)
+        ))
 
 
 class DefaultParserMeta:
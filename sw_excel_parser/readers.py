@@ -0,0 +1,479 @@
+import io
+import os
+import re
+import csv
+import mmap
+import codecs
+import zipfile
+import posixpath
+from contextlib import contextmanager
+from itertools import islice
+from typing import Any, IO, Iterable, Iterator, List, Optional, Set, Tuple, Union
+from xml.etree import ElementTree
+
+import xlrd
+
+
+class BufferStream(io.RawIOBase):
+    def __init__(self, buffer: Union[bytes, bytearray, mmap.mmap]):
+        super().__init__()
+        self.buffer = memoryview(buffer)
+        self.position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, target) -> int:
+        size = max(min(len(target), len(self.buffer) - self.position), 0)
+        target[:size] = self.buffer[self.position:self.position + size]
+        self.position += size
+
+        return size
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self.position
+        elif whence == io.SEEK_END:
+            offset += len(self.buffer)
+
+        self.position = max(offset, 0)
+
+        return self.position
+
+    def tell(self) -> int:
+        return self.position
+
+
+def open_stream(file_contents: Union[bytes, bytearray, mmap.mmap]) -> IO[bytes]:
+    if isinstance(file_contents, bytes):
+        return io.BytesIO(file_contents)
+
+    return io.BufferedReader(BufferStream(file_contents))
+
+
+def map_file(file: Any) -> Union[bytes, mmap.mmap]:
+    if isinstance(file, (str, os.PathLike)):
+        with open(file, 'rb') as opened_file:
+            return map_file(opened_file)
+
+    try:
+        return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (AttributeError, OSError, ValueError, io.UnsupportedOperation):
+        file.seek(0)
+
+        return file.read()
+
+
+def as_buffer(file_contents: Any) -> Union[bytes, bytearray, mmap.mmap]:
+    if isinstance(file_contents, memoryview):
+        if (
+            file_contents.c_contiguous
+            and isinstance(file_contents.obj, (bytes, mmap.mmap))
+            and file_contents.nbytes == len(file_contents.obj)
+        ):
+            return file_contents.obj
+
+        return file_contents.tobytes()
+
+    return file_contents
+
+
+def resolve_source(workbook: Any = None, file_contents: Any = None) -> Tuple[Any, Any, Optional[str]]:
+    file_name = None
+    if isinstance(workbook, (str, os.PathLike)) or (hasattr(workbook, 'read') and hasattr(workbook, 'seek')):
+        file_name = workbook if isinstance(workbook, (str, os.PathLike)) else getattr(workbook, 'name', None)
+        workbook, file_contents = None, map_file(workbook)
+
+    return workbook, as_buffer(file_contents), file_name
+
+
+class BaseReader:
+    def __init__(self, workbook: Any = None, file_contents: bytes = None, *args, **kwargs):
+        self.workbook = workbook
+
+    @classmethod
+    def match(cls, file_contents: bytes) -> bool:
+        return False
+
+    def get_sheets(self) -> Iterable:
+        raise NotImplementedError
+
+    def release_sheet(self, sheet) -> None:
+        pass
+
+    def iter_rows(self, sheet, start: int = 0, stop: Optional[int] = None) -> Iterator[Tuple[int, List]]:
+        raise NotImplementedError
+
+    def row_values(self, sheet, nrow: int) -> List:
+        for _, row_values in self.iter_rows(sheet, start=nrow, stop=nrow + 1):
+            return row_values
+
+        return []
+
+
+class XlrdReader(BaseReader):
+    signature = b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1'
+
+    def __init__(self, workbook: xlrd.Book = None, file_contents: bytes = None, *args, **kwargs):
+        if file_contents:
+            workbook = xlrd.open_workbook(file_contents=file_contents, on_demand=kwargs.get('on_demand', False))
+
+        super().__init__(workbook, *args, **kwargs)
+
+    @classmethod
+    def match(cls, file_contents: bytes) -> bool:
+        return file_contents[:len(cls.signature)] == cls.signature
+
+    def get_sheets(self) -> Iterable[xlrd.sheet.Sheet]:
+        if self.workbook.on_demand:
+            return (self.workbook.sheet_by_index(index) for index in range(self.workbook.nsheets))
+
+        return self.workbook.sheets()
+
+    def release_sheet(self, sheet: xlrd.sheet.Sheet) -> None:
+        if self.workbook.on_demand:
+            self.workbook.unload_sheet(sheet.name)
+
+    def iter_rows(self, sheet, start: int = 0, stop: Optional[int] = None) -> Iterator[Tuple[int, List]]:
+        if stop is None or stop > sheet.nrows:
+            stop = sheet.nrows
+
+        for nrow in range(start, stop):
+            yield nrow, self.row_values(sheet, nrow)
+
+    def row_values(self, sheet, nrow: int) -> List:
+        row_values = sheet.row_values(nrow)
+        row_types = sheet.row_types(nrow)
+        if xlrd.XL_CELL_DATE in row_types:
+            for index, cell_type in enumerate(row_types):
+                if cell_type == xlrd.XL_CELL_DATE:
+                    row_values[index] = to_datetime(row_values[index], self.workbook.datemode)
+
+        return row_values
+
+
+def to_datetime(value: float, datemode: int) -> Any:
+    try:
+        return xlrd.xldate.xldate_as_datetime(value, datemode)
+    except (xlrd.xldate.XLDateError, ValueError, OverflowError):
+        return value
+
+
+class XlsxSheet:
+    def __init__(self, name: str, path: str):
+        self.name = name
+        self.path = path
+
+    def __repr__(self):
+        return '<{cls} ({name})>'.format(cls=self.__class__.__name__, name=self.name)
+
+
+class XlsxReader(BaseReader):
+    signature = b'PK\x03\x04'
+    column_regexp = re.compile('[A-Z]+')
+    date_format_regexp = re.compile(r'"[^"]*"|\[[^\]]*\]|\\.')
+    date_format_ids = set(range(14, 23)) | {45, 46, 47}
+
+    def __init__(self, workbook: zipfile.ZipFile = None, file_contents: bytes = None, *args, **kwargs):
+        if file_contents:
+            workbook = zipfile.ZipFile(open_stream(file_contents))
+
+        super().__init__(workbook, *args, **kwargs)
+        self.shared_strings = None
+        self.date_styles = None
+        self.sheets = None
+        self.datemode = 0
+
+    @classmethod
+    def match(cls, file_contents: bytes) -> bool:
+        return file_contents[:len(cls.signature)] == cls.signature
+
+    @staticmethod
+    def local_name(tag: str) -> str:
+        return tag.rsplit('}', 1)[-1]
+
+    def get_sheets(self) -> List[XlsxSheet]:
+        if self.sheets is None:
+            self.sheets = self.read_sheets()
+
+        return self.sheets
+
+    def read_sheets(self) -> List[XlsxSheet]:
+        targets = {}
+        with self.workbook.open('xl/_rels/workbook.xml.rels') as rels_file:
+            for relationship in ElementTree.parse(rels_file).getroot():
+                target = relationship.get('Target')
+                if target.startswith('/'):
+                    target = target.lstrip('/')
+                else:
+                    target = posixpath.normpath(posixpath.join('xl', target))
+                targets[relationship.get('Id')] = target
+
+        sheets = []
+        with self.workbook.open('xl/workbook.xml') as workbook_file:
+            for element in ElementTree.parse(workbook_file).getroot().iter():
+                if self.local_name(element.tag) == 'workbookPr':
+                    self.datemode = int(element.get('date1904', 'false') in ('1', 'true'))
+                if self.local_name(element.tag) != 'sheet':
+                    continue
+
+                relationship_id = next(value for key, value in element.attrib.items() if self.local_name(key) == 'id')
+                sheets.append(XlsxSheet(element.get('name'), targets[relationship_id]))
+
+        return sheets
+
+    def get_shared_strings(self) -> List[str]:
+        if self.shared_strings is None:
+            self.shared_strings = self.read_shared_strings()
+
+        return self.shared_strings
+
+    def read_shared_strings(self) -> List[str]:
+        shared_strings = []
+        if 'xl/sharedStrings.xml' not in self.workbook.namelist():
+            return shared_strings
+
+        with self.workbook.open('xl/sharedStrings.xml') as strings_file:
+            for event, element in ElementTree.iterparse(strings_file):
+                if self.local_name(element.tag) == 'si':
+                    shared_strings.append(self.read_text(element))
+                    element.clear()
+
+        return shared_strings
+
+    def get_date_styles(self) -> Set[int]:
+        if self.date_styles is None:
+            self.date_styles = self.read_date_styles()
+
+        return self.date_styles
+
+    def read_date_styles(self) -> Set[int]:
+        date_styles = set()
+        if 'xl/styles.xml' not in self.workbook.namelist():
+            return date_styles
+
+        with self.workbook.open('xl/styles.xml') as styles_file:
+            root = ElementTree.parse(styles_file).getroot()
+
+        date_format_ids = set(self.date_format_ids)
+        for element in root.iter():
+            if self.local_name(element.tag) == 'numFmt' and self.is_date_format(element.get('formatCode', '')):
+                date_format_ids.add(int(element.get('numFmtId')))
+
+        for element in root:
+            if self.local_name(element.tag) == 'cellXfs':
+                for index, xf in enumerate(element):
+                    if int(xf.get('numFmtId', 0)) in date_format_ids:
+                        date_styles.add(index)
+
+        return date_styles
+
+    def is_date_format(self, format_code: str) -> bool:
+        format_code = self.date_format_regexp.sub('', format_code).lower()
+
+        return any(letter in format_code for letter in 'dmyhs')
+
+    def read_text(self, element: ElementTree.Element) -> str:
+        return ''.join(
+            child.text or '' for child in element.iter()
+            if self.local_name(child.tag) == 't'
+        )
+
+    def column_index(self, reference: str) -> int:
+        index = 0
+        for letter in self.column_regexp.match(reference).group():
+            index = index * 26 + ord(letter) - ord('A') + 1
+
+        return index - 1
+
+    def cell_value(self, cell: ElementTree.Element) -> Any:
+        cell_type = cell.get('t', 'n')
+        if cell_type == 'inlineStr':
+            return self.read_text(cell)
+
+        value = None
+        for child in cell:
+            if self.local_name(child.tag) == 'v':
+                value = child.text
+                break
+
+        if value is None:
+            return ''
+        elif cell_type == 's':
+            return self.get_shared_strings()[int(value)]
+        elif cell_type == 'b':
+            return int(value)
+        elif cell_type == 'n':
+            if int(cell.get('s', 0)) in self.get_date_styles():
+                return to_datetime(float(value), self.datemode)
+            return float(value)
+
+        return value
+
+    def read_row(self, row: ElementTree.Element) -> List:
+        row_values = []
+        for cell in row:
+            if self.local_name(cell.tag) != 'c':
+                continue
+
+            reference = cell.get('r')
+            if reference:
+                row_values.extend([''] * (self.column_index(reference) - len(row_values)))
+
+            row_values.append(self.cell_value(cell))
+
+        return row_values
+
+    def iter_rows(self, sheet: XlsxSheet, start: int = 0, stop: Optional[int] = None) -> Iterator[Tuple[int, List]]:
+        if stop is not None and stop <= start:
+            return
+
+        nrow = -1
+        sheet_data = None
+        with self.workbook.open(sheet.path) as sheet_file:
+            for event, element in ElementTree.iterparse(sheet_file, events=('start', 'end')):
+                tag = self.local_name(element.tag)
+                if event == 'start':
+                    if tag == 'sheetData':
+                        sheet_data = element
+                    continue
+
+                if tag != 'row':
+                    continue
+
+                row_number = int(element.get('r', nrow + 2)) - 1
+                row_values = self.read_row(element) if row_number >= start else None
+                sheet_data.clear()
+
+                for empty_nrow in range(max(nrow + 1, start), row_number):
+                    if stop is not None and empty_nrow >= stop:
+                        return
+                    yield empty_nrow, []
+
+                nrow = row_number
+                if stop is not None and nrow >= stop:
+                    return
+                if row_values is not None:
+                    yield nrow, row_values
+
+
+class CsvSheet:
+    def __init__(self, name: str):
+        self.name = name
+
+    def __repr__(self):
+        return '<{cls} ({name})>'.format(cls=self.__class__.__name__, name=self.name)
+
+
+class CsvReader(BaseReader):
+    encodings = ('utf-8-sig', 'cp1251', 'latin-1')
+    delimiters = ',;\t|'
+    sample_size = 64 * 1024
+
+    def __init__(self, workbook: Any = None, file_contents: bytes = None, *args, **kwargs):
+        super().__init__(workbook, *args, **kwargs)
+        self.file_contents = file_contents
+        self.encoding = kwargs.get('encoding')
+        self.delimiter = kwargs.get('delimiter')
+        self.sheet = CsvSheet(kwargs.get('sheet_name') or self.get_default_sheet_name(kwargs.get('file_name')))
+
+    @classmethod
+    def match(cls, file_contents: bytes) -> bool:
+        return b'\x00' not in file_contents[:cls.sample_size]
+
+    def get_default_sheet_name(self, file_name: str = None) -> str:
+        path = self.workbook if isinstance(self.workbook, (str, os.PathLike)) else getattr(self.workbook, 'name', file_name)
+        if isinstance(path, (str, os.PathLike)):
+            return os.path.splitext(os.path.basename(path))[0]
+
+        return 'csv'
+
+    def get_sheets(self) -> List[CsvSheet]:
+        return [self.sheet]
+
+    def detect_encoding(self, sample: bytes) -> str:
+        for encoding in self.encodings:
+            try:
+                codecs.getincrementaldecoder(encoding)().decode(sample, final=False)
+            except UnicodeDecodeError:
+                continue
+
+            return encoding
+
+        return self.encodings[-1]
+
+    def detect_delimiter(self, sample: str) -> str:
+        try:
+            return csv.Sniffer().sniff(sample, delimiters=self.delimiters).delimiter
+        except csv.Error:
+            first_line = sample.split('\n', 1)[0]
+
+            return max(self.delimiters, key=first_line.count)
+
+    @contextmanager
+    def open_text(self) -> Iterator[IO[str]]:
+        own_file = isinstance(self.workbook, (str, os.PathLike))
+        if own_file:
+            stream = open(self.workbook, 'rb')
+        elif self.workbook is None:
+            stream = open_stream(self.file_contents)
+        else:
+            stream = self.workbook
+            stream.seek(0)
+
+        try:
+            if isinstance(stream, io.TextIOBase):
+                yield stream
+                return
+
+            if self.encoding is None:
+                self.encoding = self.detect_encoding(stream.read(self.sample_size))
+                stream.seek(0)
+
+            text_stream = io.TextIOWrapper(stream, encoding=self.encoding, newline='')
+            try:
+                yield text_stream
+            finally:
+                text_stream.detach()
+        finally:
+            if own_file:
+                stream.close()
+
+    def iter_rows(self, sheet: CsvSheet, start: int = 0, stop: Optional[int] = None) -> Iterator[Tuple[int, List]]:
+        with self.open_text() as text_stream:
+            if self.delimiter is None:
+                self.delimiter = self.detect_delimiter(text_stream.read(self.sample_size))
+                text_stream.seek(0)
+
+            yield from islice(enumerate(csv.reader(text_stream, delimiter=self.delimiter)), start, stop)
+
+
+reader_classes = [XlsxReader, XlrdReader, CsvReader]
+
+
+def get_reader_class(file_contents: bytes) -> type:
+    for reader_class in reader_classes:
+        if reader_class.match(file_contents):
+            return reader_class
+
+    return XlrdReader
+
+
+def open_reader(workbook: Any = None, file_contents: bytes = None, reader_class: type = None, **kwargs) -> Optional[BaseReader]:
+    if not isinstance(workbook, BaseReader):
+        workbook, file_contents, file_name = resolve_source(workbook, file_contents)
+        if file_name is not None:
+            kwargs.setdefault('file_name', file_name)
+
+    if file_contents:
+        reader_class = reader_class or get_reader_class(file_contents)
+        return reader_class(file_contents=file_contents, **kwargs)
+    elif isinstance(workbook, BaseReader):
+        return workbook
+    elif workbook:
+        return XlrdReader(workbook=workbook)
+
+    return None
@@ -0,0 +1,77 @@
+import csv
+import json
+from typing import Any, IO, Iterable, Sequence, Tuple, Union
+
+
+class BaseSink:
+    def __init__(self, file: Union[str, IO] = None, encoding: str = 'utf-8'):
+        self.own_file = isinstance(file, str)
+        self.file = open(file, 'w', encoding=encoding, newline='') if self.own_file else file
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def write(self, sheet_name: str, columns: Sequence[str], rows: Iterable[Tuple]) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        if self.own_file:
+            self.file.close()
+
+
+class CsvSink(BaseSink):
+    def __init__(self, file: Union[str, IO], encoding: str = 'utf-8', **fmtparams):
+        super().__init__(file, encoding)
+        self.writer = csv.writer(self.file, **fmtparams)
+        self.header_written = False
+
+    def write(self, sheet_name: str, columns: Sequence[str], rows: Iterable[Tuple]) -> None:
+        if not self.header_written:
+            self.writer.writerow(columns)
+            self.header_written = True
+
+        self.writer.writerows(rows)
+
+
+class JsonLinesSink(BaseSink):
+    @staticmethod
+    def default(value: Any) -> str:
+        if hasattr(value, 'isoformat'):
+            return value.isoformat()
+
+        return str(value)
+
+    def write(self, sheet_name: str, columns: Sequence[str], rows: Iterable[Tuple]) -> None:
+        self.file.write(''.join(
+            json.dumps(dict(zip(columns, row)), ensure_ascii=False, default=self.default) + '\n'
+            for row in rows
+        ))
+
+
+class DbApiSink(BaseSink):
+    def __init__(self, connection, table: str, placeholder: str = '?', commit: bool = True):
+        super().__init__()
+        self.connection = connection
+        self.table = table
+        self.placeholder = placeholder
+        self.commit = commit
+
+    def get_query(self, columns: Sequence[str]) -> str:
+        return 'INSERT INTO {table} ({columns}) VALUES ({values})'.format(
+            table=self.table,
+            columns=', '.join(columns),
+            values=', '.join([self.placeholder] * len(columns))
+        )
+
+    def write(self, sheet_name: str, columns: Sequence[str], rows: Iterable[Tuple]) -> None:
+        cursor = self.connection.cursor()
+        try:
+            cursor.executemany(self.get_query(columns), rows)
+        finally:
+            cursor.close()
+
+        if self.commit:
+            self.connection.commit()
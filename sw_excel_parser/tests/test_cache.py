@@ -0,0 +1,134 @@
+import os
+import tempfile
+from collections import OrderedDict
+from unittest import TestCase
+from unittest import mock
+
+from sw_excel_parser import cache
+from sw_excel_parser import fields
+from sw_excel_parser import parsers
+from sw_excel_parser import validators
+from sw_excel_parser.tests.utils import make_xlsx
+
+
+class CachedParser(parsers.Parser):
+    foo = fields.CharField(header='foo')
+    bar = fields.IntegerField(header='bar')
+
+
+class FingerprintTestCase(TestCase):
+    def test_fingerprint(self):
+        class FirstParser(parsers.Parser):
+            foo = fields.CharField(header='foo', validators=[validators.EmailValidator()])
+
+        class SecondParser(parsers.Parser):
+            foo = fields.CharField(header='foo', validators=[validators.EmailValidator()])
+
+        class RequiredParser(parsers.Parser):
+            foo = fields.CharField(header='foo', required=False, validators=[validators.EmailValidator()])
+
+        class CleanerParser(parsers.Parser):
+            foo = fields.CharField(header='foo', validators=[validators.EmailValidator()])
+
+            class Meta:
+                item_class = type('CleanerItem', (parsers.Parser.Meta.item_class,), dict(
+                    clean_foo=lambda self, value: value
+                ))
+
+        fingerprints = [
+            cache.get_fingerprint(parser_class.engine_class)
+            for parser_class in (FirstParser, SecondParser, RequiredParser, CleanerParser)
+        ]
+
+        self.assertEqual(fingerprints[0], cache.get_fingerprint(FirstParser.engine_class))
+        self.assertEqual(len(set(fingerprints)), 4)
+
+    def test_cache_key(self):
+        self.assertEqual(
+            cache.get_cache_key(b'contents', CachedParser.engine_class),
+            cache.get_cache_key(b'contents', CachedParser.engine_class)
+        )
+        self.assertNotEqual(
+            cache.get_cache_key(b'contents', CachedParser.engine_class),
+            cache.get_cache_key(b'other contents', CachedParser.engine_class)
+        )
+
+
+class MemoryCacheTestCase(TestCase):
+    def test_lru_eviction(self):
+        result_cache = cache.MemoryCache(max_size=len(cache.pickle.dumps(dict(value='a' * 100), -1)) * 2)
+        result_cache.set('first', dict(value='a' * 100))
+        result_cache.set('second', dict(value='b' * 100))
+
+        self.assertEqual(result_cache.get('first'), dict(value='a' * 100))
+
+        result_cache.set('third', dict(value='c' * 100))
+
+        self.assertIsNone(result_cache.get('second'))
+        self.assertEqual(result_cache.get('first'), dict(value='a' * 100))
+        self.assertEqual(result_cache.get('third'), dict(value='c' * 100))
+        self.assertLessEqual(result_cache.size, result_cache.max_size)
+
+    def test_oversized_value(self):
+        result_cache = cache.MemoryCache(max_size=10)
+        result_cache.set('key', dict(value='a' * 100))
+
+        self.assertIsNone(result_cache.get('key'))
+
+
+class FileSystemCacheTestCase(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def test_get_set(self):
+        result_cache = cache.FileSystemCache(self.directory.name)
+        result_cache.set('key', dict(value=[1, 2, 3]))
+
+        self.assertEqual(result_cache.get('key'), dict(value=[1, 2, 3]))
+        self.assertIsNone(result_cache.get('missing'))
+
+    def test_size_eviction(self):
+        size = len(cache.pickle.dumps(dict(value='a' * 100), -1))
+        result_cache = cache.FileSystemCache(self.directory.name, max_size=size * 2)
+        for key in ('first', 'second', 'third'):
+            result_cache.set(key, dict(value='a' * 100))
+
+        cached_files = os.listdir(self.directory.name)
+        self.assertEqual(len(cached_files), 2)
+        self.assertNotIn('first' + result_cache.suffix, cached_files)
+
+
+class ParserCacheTestCase(TestCase):
+    def setUp(self):
+        self.file_contents = make_xlsx(OrderedDict(sheet=[['foo', 'bar'], ['foo', 1], ['', 'bar']]))
+        self.cache = cache.MemoryCache()
+
+    def test_cache_hit(self):
+        parser = CachedParser(file_contents=self.file_contents, cache=self.cache)
+        parser.parse()
+
+        self.assertEqual(len(self.cache.entries), 1)
+
+        with mock.patch.object(CachedParser.engine_class, 'open_workbook') as open_workbook:
+            cached_parser = CachedParser(file_contents=self.file_contents, cache=self.cache)
+            cached_parser.parse()
+
+        open_workbook.assert_not_called()
+        self.assertEqual(cached_parser.get_cleaned_data(), parser.get_cleaned_data())
+        self.assertEqual(cached_parser.stats, parser.stats)
+        self.assertEqual(cached_parser.errors, parser.errors)
+
+    def test_partial_results_are_not_cached(self):
+        parser = CachedParser(file_contents=self.file_contents, cache=self.cache, max_errors=0)
+        parser.parse()
+
+        self.assertTrue(parser.stats['partial'])
+        self.assertEqual(len(self.cache.entries), 0)
+
+    def test_workbook_opened_on_demand(self):
+        parser = CachedParser(file_contents=self.file_contents, cache=self.cache)
+
+        self.assertIsNone(parser.workbook)
+        self.assertTrue(parser.is_recognized())
+        self.assertIsNotNone(parser.workbook)
@@ -0,0 +1,67 @@
+from collections import OrderedDict
+from unittest import TestCase
+from unittest import mock
+
+from sw_excel_parser import dispatchers
+from sw_excel_parser import fields
+from sw_excel_parser import parsers
+from sw_excel_parser import readers
+from sw_excel_parser.tests.utils import make_xlsx
+
+
+class SupplierParser(parsers.Parser):
+    sku = fields.CharField(header='SKU')
+    price = fields.FloatField(header='Price')
+
+
+class DetailedSupplierParser(parsers.Parser):
+    sku = fields.CharField(header='SKU')
+    price = fields.FloatField(header='Price')
+    stock = fields.IntegerField(header='Stock')
+
+
+class ContactsParser(parsers.Parser):
+    name = fields.CharField(header='Name')
+    email = fields.EmailField(header='Email')
+
+
+class DispatcherTestCase(TestCase):
+    def setUp(self):
+        self.dispatcher = dispatchers.Dispatcher([SupplierParser, DetailedSupplierParser, ContactsParser])
+        self.file_contents = make_xlsx(OrderedDict([
+            ('prices', [['Price list'], [' sku ', 'PRICE', 'Stock', 'Note'], ['a', 1.0, 2, '']]),
+            ('contacts', [['Name', 'Email'], ['foo', 'foo@bar.baz']]),
+            ('notes', [['Anything']]),
+        ]))
+
+    def test_index(self):
+        self.assertEqual(self.dispatcher.index['sku'], [SupplierParser, DetailedSupplierParser])
+        self.assertIs(self.dispatcher.register(SupplierParser), SupplierParser)
+        self.assertEqual(len(self.dispatcher.parser_classes), 3)
+
+    def test_scan(self):
+        result = self.dispatcher.scan(file_contents=self.file_contents)
+
+        self.assertEqual(
+            [(sheet.name, [(match.parser_class, match.header_nrow, match.coverage) for match in matches])
+             for sheet, matches in result.items()],
+            [
+                ('prices', [(DetailedSupplierParser, 1, 0.75), (SupplierParser, 1, 0.5)]),
+                ('contacts', [(ContactsParser, 0, 1.0)]),
+                ('notes', [])
+            ]
+        )
+
+    def test_single_pass(self):
+        with mock.patch.object(readers.XlsxReader, 'iter_rows', autospec=True, side_effect=readers.XlsxReader.iter_rows) as iter_rows:
+            self.dispatcher.scan(file_contents=self.file_contents)
+
+        self.assertEqual(iter_rows.call_count, 3)
+
+    def test_get_parser_class(self):
+        parser_class = self.dispatcher.get_parser_class(file_contents=self.file_contents)
+        self.assertIs(parser_class, ContactsParser)
+
+        parser = parser_class(file_contents=self.file_contents)
+        self.assertTrue(parser.is_recognized())
+        self.assertIsNone(self.dispatcher.get_parser_class(file_contents=make_xlsx(OrderedDict(sheet=[['foo']]))))
@@ -1,6 +1,8 @@
 import uuid
 import random
+import datetime
 from unittest import TestCase
+from unittest import mock
 
 import dateutil.parser
 
@@ -121,6 +123,27 @@ class DateFieldTestCase(FieldTestCase):
 
         self.assertEqual(str(e.exception), 'Некорректное значение.')
 
+    def test_native_dates(self):
+        self.assertEqual(self.test_item.foo.to_python(datetime.datetime(2011, 5, 5, 10)), datetime.date(2011, 5, 5))
+        self.assertEqual(self.test_item.foo.to_python(datetime.date(2011, 5, 5)), datetime.date(2011, 5, 5))
+
+    def test_formats(self):
+        class TestItem(items.Item):
+            foo = fields.DateField(header='foo', formats=['%d/%m/%Y'])
+
+        field = TestItem._bound_fields['foo']
+        with mock.patch.object(fields.dateutil.parser, 'parse', wraps=dateutil.parser.parse) as parse:
+            self.assertEqual(field.to_python(' 01/02/2011 '), datetime.date(2011, 2, 1))
+            self.assertEqual(field.to_python('2011-02-03'), datetime.date(2011, 2, 3))
+            self.assertEqual(parse.call_count, 1)
+
+    def test_parse_cache(self):
+        fields.parse_date.cache_clear()
+        self.test_item.bar.to_python('2012.06.06')
+        self.test_item.bar.to_python('2012.06.06')
+
+        self.assertEqual(fields.parse_date.cache_info().hits, 1)
+
 
 class FloatFieldTestCase(FieldTestCase):
     def setUp(self):
@@ -170,6 +193,39 @@ class IntegerFieldTestCase(FieldTestCase):
         self.assertEqual(str(e.exception), 'Некорректное значение.')
 
 
+class CategoricalCharFieldTestCase(TestCase):
+    def setUp(self):
+        class TestItem(items.Item):
+            region = fields.CharField(header='region', categorical=True, max_categories=4)
+
+        self.test_item_class = TestItem
+        self.field = TestItem._bound_fields['region']
+
+    def test_field_to_python(self):
+        first = self.field.to_python(' north ')
+        second = self.field.to_python(''.join(['nor', 'th']))
+        third = self.field.to_python(' north ')
+
+        self.assertEqual(first, 'north')
+        self.assertIs(second, first)
+        self.assertIs(third, first)
+        self.assertEqual(self.field.to_python(1.0), '1.0')
+        self.assertEqual(self.field.get_categories(), ['north'])
+
+    def test_max_categories(self):
+        for value in ('a', 'b', 'c', 'd', 'e'):
+            self.assertEqual(self.field.to_python(' {} '.format(value)), value)
+
+        self.assertEqual(self.field.get_categories(), ['a', 'b'])
+        self.assertEqual(len(self.field.categories), 4)
+
+    def test_codes(self):
+        rows = [self.test_item_class(nrow=nrow, data=dict(region=region)) for nrow, region in enumerate(['south', 'north ', ' south'])]
+
+        self.assertEqual([item.get_code('region') for item in rows], [0, 1, 0])
+        self.assertIs(rows[0].cleaned_data['region'], rows[2].cleaned_data['region'])
+
+
 class EmailFieldTestCase(CharFieldTestCase):
     def setUp(self):
         class TestItem(items.Item):
@@ -204,3 +260,41 @@ class UUIDFieldTestCase(FieldTestCase):
             self.test_item.bar.to_python('testUUID')
 
         self.assertEqual(str(e.exception), 'Некорректное значение.')
+
+
+class ColumnarCleanTestCase(TestCase):
+    def setUp(self):
+        class TestItem(items.Item):
+            foo = fields.IntegerField(header='foo', min_value=10)
+            bar = fields.FloatField(header='bar', required=False, max_value=100)
+            baz = fields.CharField(header='baz', required=False)
+
+        self.test_item_class = TestItem
+        values = [
+            (20.0, 1.5), (5.0, 200.0), (11.5, 0.0), (0.0, 99.0), ('12', '7.5'), ('qux', 'quux'),
+            (2.0 ** 60, 1.0), (float('nan'), float('nan')), (999.0, 101.0),
+        ]
+        self.rows = [(nrow, (foo, bar, 'corge')) for nrow, (foo, bar) in enumerate(values)]
+
+    def assert_same_items(self):
+        expected_items = self.test_item_class.from_rows(self.rows)
+        columnar_items = self.test_item_class.from_rows(self.rows, columnar=True)
+
+        for expected_item, columnar_item in zip(expected_items, columnar_items):
+            self.assertEqual(repr(columnar_item.cleaned_data), repr(expected_item.cleaned_data))
+            self.assertEqual(
+                {name: str(error) for name, error in columnar_item.errors.items()},
+                {name: str(error) for name, error in expected_item.errors.items()}
+            )
+
+        self.assertEqual(columnar_items[6].cleaned_data['foo'], 2 ** 60)
+
+    def test_columnar_numpy(self):
+        if fields.numpy is None:
+            self.skipTest('NumPy is not installed')
+
+        self.assert_same_items()
+
+    def test_columnar_pure_python(self):
+        with mock.patch.object(fields, 'numpy', None):
+            self.assert_same_items()
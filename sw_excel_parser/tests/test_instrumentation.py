@@ -0,0 +1,60 @@
+import os
+from unittest import TestCase
+from unittest import mock
+
+import xlrd
+
+from sw_excel_parser import fields
+from sw_excel_parser import parsers
+from sw_excel_parser import instrumentation
+
+
+class InstrumentationTestCase(TestCase):
+    file_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'test_book.xls')
+
+    def setUp(self):
+        self.workbook = xlrd.open_workbook(self.file_path)
+
+        class TestParser(parsers.Parser):
+            foo = fields.CharField(header='foo')
+            bar = fields.CharField(header='bar')
+            baz = fields.CharField(header='baz')
+
+        self.parser_class = TestParser
+
+    def test_disabled(self):
+        parser = self.parser_class(workbook=self.workbook)
+        parser.parse()
+
+        self.assertIsNone(parser.timings)
+        self.assertIs(parser.get_item_class(), parser.item)
+
+    def test_timings(self):
+        callback = mock.Mock()
+        parser = self.parser_class(workbook=self.workbook, callbacks=[callback])
+        parser.parse()
+
+        timings = parser.timings
+        self.assertEqual(
+            list(timings['phases']),
+            ['open', 'find_headers', 'build_items']
+        )
+        self.assertEqual(timings['phases']['build_items']['rows'], 2)
+        self.assertEqual({name: record['rows'] for name, record in timings['sheets'].items()},
+                         {name: 1 for name in self.workbook.sheet_names()})
+        self.assertEqual({name: record['calls'] for name, record in timings['fields'].items()},
+                         dict(foo=2, bar=2, baz=2))
+        self.assertEqual(parser.get_cleaned_data()[self.workbook.sheet_names()[1]],
+                         [dict(foo='fred', bar='plugh', baz='xyzzy')])
+
+        phases = [call[0][0] for call in callback.call_args_list]
+        self.assertEqual(phases, ['open', 'find_headers', 'build_items', 'build_items'])
+        self.assertEqual(callback.call_args_list[2][0][1]['sheet'], self.workbook.sheet_names()[0])
+
+    def test_statsd_callback(self):
+        client = mock.Mock()
+        callback = instrumentation.StatsdCallback(client, prefix='parser')
+        callback('build_items', dict(seconds=0.5, rows=10))
+
+        client.timing.assert_called_with('parser.build_items', 500)
+        client.incr.assert_called_with('parser.build_items.rows', 10)
@@ -1,9 +1,16 @@
+import pickle
 import random
 from unittest import TestCase
 from unittest import mock
 
 from sw_excel_parser import fields
 from sw_excel_parser import items
+from sw_excel_parser import parsers
+
+
+class CompactParser(parsers.Parser):
+    foo = fields.CharField(header='Foo')
+    bar = fields.IntegerField(header='Bar')
 
 
 class ItemTestCase(TestCase):
@@ -45,3 +52,61 @@ class ItemTestCase(TestCase):
             self.assertFalse(mocked_item.is_valid())
 
         mocked_cleaner.assert_called_with('foo')
+
+    def test_field_plan(self):
+        class TestItem(items.Item):
+            foo = fields.CharField(header='Foo')
+            bar = fields.CharField(header='Bar', required=False)
+
+        self.assertEqual([name for name, field, cleaner_name in TestItem._field_plan], ['foo', 'bar'])
+
+        first_item = TestItem(nrow=1, data=dict(foo=' foo '))
+        second_item = TestItem(nrow=2, data=dict(foo='bar'))
+
+        self.assertIs(first_item.fields, second_item.fields)
+        self.assertIs(first_item.foo, second_item.foo)
+        self.assertIs(first_item.foo, TestItem._bound_fields['foo'])
+        self.assertEqual(first_item.cleaned_data, dict(foo='foo', bar=None))
+        self.assertEqual(second_item.cleaned_data, dict(foo='bar', bar=None))
+
+    def test_cleaner_sees_cleaned_data(self):
+        class TestItem(items.Item):
+            foo = fields.CharField(header='foo')
+            bar = fields.CharField(header='bar')
+            baz = fields.IntegerField(header='baz', required=False)
+
+            def clean_bar(self, value):
+                return self.cleaned_data['foo'] + value
+
+        item = TestItem(nrow=1, data=dict(foo='a', bar='b', baz='baz'))
+
+        self.assertEqual(item.cleaned_data, dict(foo='a', bar='ab'))
+        self.assertEqual(list(item.errors), ['baz'])
+
+    def test_compact_storage(self):
+        item = CompactParser.item_class(nrow=1, data=dict(foo=' foo ', bar='bar', baz='baz'))
+
+        self.assertFalse(hasattr(item, '__dict__'))
+        self.assertEqual(item.values, (' foo ', 'bar'))
+        self.assertEqual(item.data, dict(foo=' foo ', bar='bar'))
+        self.assertEqual(item.cleaned_data, dict(foo='foo'))
+        self.assertEqual(list(item.errors), ['bar'])
+        self.assertFalse(item.is_valid())
+
+        restored_item = pickle.loads(pickle.dumps(item))
+        self.assertEqual(restored_item.nrow, item.nrow)
+        self.assertEqual(restored_item.cleaned_data, item.cleaned_data)
+        self.assertEqual(str(restored_item.errors['bar']), str(item.errors['bar']))
+
+    def test_lazy_validation(self):
+        item_class = CompactParser.item_class
+
+        with mock.patch.object(item_class, 'validate', autospec=True, side_effect=items.Item.validate) as validate:
+            item = item_class.from_values(1, (' foo ', 'bar'), lazy=True)
+            self.assertFalse(item.is_validated())
+            validate.assert_not_called()
+
+            self.assertEqual(list(item.errors), ['bar'])
+            self.assertEqual(item.cleaned_data, dict(foo='foo'))
+            self.assertFalse(item.is_valid())
+            self.assertEqual(validate.call_count, 1)
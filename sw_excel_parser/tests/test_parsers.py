@@ -1,10 +1,26 @@
 import os
+import time
+import pickle
+import asyncio
+import tempfile
+import threading
+from collections import OrderedDict
 from unittest import TestCase
+from unittest import mock
 
 import xlrd
 
 from sw_excel_parser import parsers
 from sw_excel_parser import fields
+from sw_excel_parser import engines
+from sw_excel_parser import validators
+from sw_excel_parser.tests.utils import make_xlsx
+
+
+class ModuleParser(parsers.Parser):
+    foo = fields.CharField(header='foo')
+    bar = fields.CharField(header='bar')
+    baz = fields.CharField(header='baz')
 
 
 class ParserTestCase(TestCase):
@@ -38,12 +54,457 @@ class ParserTestCase(TestCase):
     def test_find_headers(self):
         self.assertEqual(list(self.parser.find_headers().values()), [4, 1])
 
+    def test_find_headers_cache(self):
+        with mock.patch.object(self.parser.engine, 'scan_headers', wraps=self.parser.engine.scan_headers) as scan:
+            self.parser.find_headers()
+            self.parser.parse()
+            self.parser.is_recognized()
+            self.assertEqual(scan.call_count, 1)
+
+            self.parser.set_workbook(workbook=self.workbook)
+            self.parser.find_headers()
+            self.assertEqual(scan.call_count, 2)
+
+    def test_max_header_scan_rows(self):
+        parser = self.parser_class(workbook=self.workbook, max_header_scan_rows=2)
+        self.assertEqual(list(parser.find_headers().values()), [1])
+
+    def test_on_demand(self):
+        with open(self.file_path, 'rb') as workbook_file:
+            file_contents = workbook_file.read()
+
+        parser = self.parser_class(file_contents=file_contents, on_demand=True, max_header_scan_rows=2)
+        parser.parse()
+
+        self.assertFalse(parser.workbook.sheet_loaded(0))
+        self.assertTrue(parser.workbook.sheet_loaded(1))
+        self.assertEqual([sheet.name for sheet in parser.keys()], [self.workbook.sheet_names()[1]])
+
     def test_get_header(self):
         self.assertEqual(self.parser.get_header(self.workbook.sheets()[0]), ['', '', 'Foo ', '  Bar ', 'Baz'])
 
+    def test_get_column_map(self):
+        sheets = self.workbook.sheets()
+
+        self.assertEqual(self.parser.get_column_map(sheets[0]), (2, 3, 4))
+        self.assertEqual(self.parser.get_column_map(sheets[1]), (0, 1, 2))
+
+    def test_row_extractor(self):
+        extract_values = engines.make_row_extractor((3, 0))
+        self.assertEqual(extract_values(['a', 'b', 'c', 'd', 'e']), ('d', 'a'))
+        self.assertEqual(extract_values(['a', 'b']), (None, 'a'))
+
+        self.assertEqual(engines.make_row_extractor((1,))(['a', 'b']), ('b',))
+        self.assertEqual(engines.make_row_extractor((None, 1))(['a', 'b']), (None, 'b'))
+        self.assertEqual(engines.make_row_extractor(())(['a', 'b']), ())
+
     def test_parse(self):
         self.parser.parse()
         self.assertEqual(len(self.parser.sheet_items.values()), 2)
 
+    def test_stats_and_errors(self):
+        self.parser.parse()
+        stats = self.parser.stats
+        errors = self.parser.errors
+
+        self.assertEqual(stats, dict(total_count=2, success_count=1, errors_count=1, erroneous_sheets=['Лист1'], partial=False))
+        self.assertEqual(errors['bar'], dict(label='bar', rows=[dict(nrow=5, value='', error='Это поле обязательно.')]))
+
+        self.parser.compute_stats()
+        self.parser.collect_errors()
+
+        self.assertEqual(self.parser.stats, stats)
+        self.assertEqual(self.parser.errors, errors)
+
+    def test_lazy_parse(self):
+        parser = self.parser_class(workbook=self.workbook, lazy=True)
+        parser.parse()
+        items = [item for sheet, sheet_items in parser.items() for item in sheet_items]
+
+        self.assertEqual(len(items), 2)
+        self.assertFalse(any(item.is_validated() for item in items))
+
+        self.parser.parse()
+        self.assertEqual(parser.stats, self.parser.stats)
+        self.assertEqual(parser.errors, self.parser.errors)
+        self.assertTrue(all(item.is_validated() for item in items))
+
+    def test_preview(self):
+        preview = self.parser.preview(1)
+
+        self.assertEqual([len(items) for items in preview.values()], [1])
+        self.assertTrue(all(item.is_validated() for items in preview.values() for item in items))
+        self.assertEqual(self.parser.sheet_items, {})
+
+        lazy_parser = self.parser_class(workbook=self.workbook, lazy=True)
+        self.assertEqual(
+            [item.cleaned_data for items in lazy_parser.preview(5).values() for item in items],
+            [item.cleaned_data for items in self.parser.preview(5).values() for item in items]
+        )
+
     def test_is_recognized(self):
         self.assertTrue(self.parser.is_recognized())
+
+    def test_iter_items(self):
+        streamed = list(self.parser.iter_items())
+        stream_stats = dict(self.parser.stats)
+        stream_errors = dict(self.parser.errors)
+
+        self.assertEqual(len(streamed), 2)
+        self.assertEqual(self.parser.sheet_items, {})
+
+        self.parser.parse()
+        parsed = [(sheet, item) for sheet, items in self.parser.items() for item in items]
+
+        self.assertEqual([(sheet, item.nrow) for sheet, item in streamed], [(sheet, item.nrow) for sheet, item in parsed])
+        self.assertEqual(stream_stats, self.parser.stats)
+        self.assertEqual(stream_errors, self.parser.errors)
+
+    def test_iter_batches(self):
+        batches = list(self.parser.iter_batches(batch_size=1))
+
+        self.assertEqual([len(batch) for sheet, batch in batches], [1, 1])
+        self.assertEqual([sheet.name for sheet, batch in batches], self.workbook.sheet_names())
+
+    def test_parallel_parse(self):
+        serial_parser = ModuleParser(workbook=self.workbook)
+        serial_parser.parse()
+
+        for executor in ('process', 'thread'):
+            parser = ModuleParser(workbook=self.workbook, chunk_size=1)
+            parser.parse(workers=2, executor=executor)
+
+            self.assertEqual(parser.get_cleaned_data(), serial_parser.get_cleaned_data())
+            self.assertEqual(parser.stats, serial_parser.stats)
+            self.assertEqual(parser.errors, serial_parser.errors)
+            self.assertEqual(
+                [[item.nrow for item in items] for items in parser.values()],
+                [[item.nrow for item in items] for items in serial_parser.values()]
+            )
+
+        with self.assertRaises(ValueError):
+            ModuleParser(workbook=self.workbook).parse(workers=2, executor='fiber')
+
+    def test_columnar_parse(self):
+        serial_parser = ModuleParser(workbook=self.workbook)
+        serial_parser.parse()
+
+        parser = ModuleParser(workbook=self.workbook, columnar=True)
+        parser.parse()
+
+        self.assertEqual(parser.get_cleaned_data(), serial_parser.get_cleaned_data())
+        self.assertEqual(parser.errors, serial_parser.errors)
+
+
+class ErrorBudgetTestCase(TestCase):
+    def setUp(self):
+        rows = [['foo', 'bar', 'baz']] + [['foo', 'bar', 'baz']] * 2 + [[None, 'bar', 'baz']] * 8
+        self.file_contents = make_xlsx(OrderedDict(first=rows, second=rows))
+
+    def test_full_parse(self):
+        parser = ModuleParser(file_contents=self.file_contents)
+        parser.parse()
+
+        self.assertEqual(parser.stats['total_count'], 20)
+        self.assertFalse(parser.stats['partial'])
+        self.assertFalse(parser.errors['non_field_errors']['partial'])
+
+    def test_max_errors(self):
+        parser = ModuleParser(file_contents=self.file_contents, max_errors=3)
+        parser.parse()
+
+        self.assertEqual(parser.stats['total_count'], 6)
+        self.assertEqual(parser.stats['errors_count'], 4)
+        self.assertTrue(parser.stats['partial'])
+        self.assertTrue(parser.errors['non_field_errors']['partial'])
+        self.assertEqual(len(parser.errors['foo']['rows']), 4)
+
+        parser.compute_stats()
+        self.assertTrue(parser.stats['partial'])
+
+    def test_max_error_rate(self):
+        parser = ModuleParser(file_contents=self.file_contents, max_error_rate=0.5, error_rate_min_rows=5)
+        parser.parse()
+
+        self.assertEqual(parser.stats['total_count'], 5)
+        self.assertTrue(parser.stats['partial'])
+
+        parser = ModuleParser(file_contents=self.file_contents, max_error_rate=0.9, error_rate_min_rows=5)
+        parser.parse()
+
+        self.assertEqual(parser.stats['total_count'], 20)
+        self.assertFalse(parser.stats['partial'])
+
+    def test_lazy_max_errors(self):
+        parser = ModuleParser(file_contents=self.file_contents, max_errors=0, lazy=True)
+        parser.parse()
+
+        self.assertEqual(parser.stats['total_count'], 3)
+        self.assertTrue(parser.stats['partial'])
+
+    def test_parallel_max_errors(self):
+        parser = ModuleParser(file_contents=self.file_contents, max_errors=3, workers=2, executor='thread', chunk_size=2)
+        parser.parse()
+
+        self.assertEqual(parser.stats['total_count'], 6)
+        self.assertTrue(parser.stats['partial'])
+
+
+class AsyncParserTestCase(TestCase):
+    def setUp(self):
+        rows = [['foo', 'bar', 'baz']] + [['foo', 'bar', 'baz'], [None, 'bar', 'baz']] * 5
+        self.file_contents = make_xlsx(OrderedDict(first=rows, second=rows))
+        self.loop = asyncio.new_event_loop()
+        self.addCleanup(self.loop.close)
+
+    def test_aparse(self):
+        parser = ModuleParser(file_contents=self.file_contents)
+        parser.parse()
+
+        async_parser = ModuleParser(file_contents=self.file_contents, lazy_open=True)
+        self.assertIsNone(async_parser.reader)
+
+        self.loop.run_until_complete(async_parser.aparse(chunk_size=3))
+
+        self.assertIsNotNone(async_parser.reader)
+        self.assertEqual(async_parser.get_cleaned_data(), parser.get_cleaned_data())
+        self.assertEqual(async_parser.stats, parser.stats)
+        self.assertEqual(async_parser.errors, parser.errors)
+
+    def test_astream(self):
+        parser = ModuleParser(file_contents=self.file_contents)
+
+        async def collect():
+            return [(sheet.name, item.nrow) async for sheet, item in parser.astream(chunk_size=3)]
+
+        streamed = self.loop.run_until_complete(collect())
+
+        self.assertEqual(streamed, [(sheet.name, item.nrow) for sheet, item in parser.iter_items()])
+        self.assertEqual(parser.sheet_items, {})
+
+    def test_concurrency_limit(self):
+        active, peaks = [], []
+        iter_items = ModuleParser.engine_class.iter_items
+
+        def slow_iter_items(engine):
+            active.append(engine)
+            peaks.append(len(active))
+            time.sleep(0.01)
+            yield from iter_items(engine)
+            active.remove(engine)
+
+        async def parse_all():
+            semaphore = asyncio.Semaphore(1)
+            parsers_list = [ModuleParser(file_contents=self.file_contents, semaphore=semaphore) for _ in range(3)]
+            await asyncio.gather(*(parser.aparse() for parser in parsers_list))
+
+            return parsers_list
+
+        with mock.patch.object(ModuleParser.engine_class, 'iter_items', slow_iter_items):
+            parsers_list = self.loop.run_until_complete(parse_all())
+
+        self.assertEqual(max(peaks), 1)
+        self.assertTrue(all(parser.stats['total_count'] == 20 for parser in parsers_list))
+
+    def test_cancellation(self):
+        started, closed = threading.Event(), threading.Event()
+
+        def blocking_iter_items(engine):
+            try:
+                while True:
+                    started.set()
+                    time.sleep(0.01)
+                    yield None, None
+            finally:
+                closed.set()
+
+        async def consume():
+            async for sheet, item in parser.astream(chunk_size=10 ** 6):
+                pass
+
+        async def cancel():
+            task = asyncio.ensure_future(consume())
+            while not started.is_set():
+                await asyncio.sleep(0.01)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        parser = ModuleParser(file_contents=self.file_contents)
+        with mock.patch.object(ModuleParser.engine_class, 'iter_items', blocking_iter_items):
+            self.loop.run_until_complete(cancel())
+
+        self.assertTrue(closed.wait(1))
+
+
+class LookupValidator(validators.BatchValidator):
+    message = 'Значение не найдено.'
+
+    def __init__(self, known, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.known = known
+        self.calls = []
+
+    async def validate_batch(self, field, nrows, values, context):
+        self.calls.append(list(nrows))
+        await asyncio.sleep(0)
+
+        return {nrow: validators.ValidationError(self.message) for nrow, value in zip(nrows, values) if value not in self.known}
+
+
+class BatchValidatorsTestCase(TestCase):
+    def setUp(self):
+        rows = [['foo', 'bar', 'baz'], ['a', 'x', 'baz'], ['b', 'x', 'baz'], ['a', 'y', 'baz'], ['', 'z', 'baz']]
+        self.file_contents = make_xlsx(OrderedDict(first=rows, second=rows))
+        self.lookup = LookupValidator({'x', 'y'})
+
+        class BatchParser(parsers.Parser):
+            foo = fields.CharField(header='foo', validators=[validators.UniqueValidator()])
+            bar = fields.CharField(header='bar', validators=[validators.ChoicesValidator(['x', 'y', 'z']), self.lookup])
+            baz = fields.CharField(header='baz')
+
+        self.parser_class = BatchParser
+
+    def test_parse(self):
+        parser = self.parser_class(file_contents=self.file_contents, chunk_size=2)
+        parser.parse()
+
+        self.assertEqual(parser.stats['total_count'], 8)
+        self.assertEqual([row['nrow'] for row in parser.errors['foo']['rows']], [3, 4, 1, 2, 3, 4])
+        self.assertEqual(parser.errors['foo']['rows'][0]['error'], 'Значение не уникально.')
+        self.assertEqual([row['nrow'] for row in parser.errors['bar']['rows']], [4, 4])
+        self.assertEqual(parser.errors['bar']['rows'][0]['error'], 'Значение не найдено.')
+        self.assertEqual(self.lookup.calls, [[1, 2], [3, 4], [1, 2], [3, 4]])
+
+        first_item = next(iter(parser.values()))[0]
+        self.assertTrue(first_item.is_valid())
+        self.assertEqual(first_item.cleaned_data, dict(foo='a', bar='x', baz='baz'))
+
+    def test_aparse(self):
+        parser = self.parser_class(file_contents=self.file_contents)
+        parser.parse()
+
+        async_parser = self.parser_class(file_contents=self.file_contents)
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+        loop.run_until_complete(async_parser.aparse())
+
+        self.assertEqual(async_parser.errors, parser.errors)
+        self.assertEqual(async_parser.stats, parser.stats)
+
+
+class CheckpointTestCase(TestCase):
+    def setUp(self):
+        rows = [['foo', 'bar', 'baz']] + [['foo', 'bar', 'baz'], [None, 'bar', 'baz']] * 3
+        self.file_contents = make_xlsx(OrderedDict(first=rows, second=rows))
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.checkpoint_path = os.path.join(directory.name, 'import.checkpoint')
+
+    def crash_after(self, count):
+        parser = ModuleParser(file_contents=self.file_contents, checkpoint_path=self.checkpoint_path, chunk_size=4)
+        items = parser.iter_items()
+        for sheet, item in items:
+            count -= 1
+            if not count:
+                break
+        items.close()
+
+    def test_resume(self):
+        full_parser = ModuleParser(file_contents=self.file_contents)
+        full_parser.parse()
+
+        self.crash_after(10)
+
+        parser = ModuleParser(file_contents=self.file_contents, checkpoint_path=self.checkpoint_path, chunk_size=4)
+        parser.parse(resume_from=self.checkpoint_path)
+
+        self.assertEqual([(sheet.name, [item.nrow for item in items]) for sheet, items in parser.items()], [('second', [3, 4, 5, 6])])
+        self.assertEqual(parser.stats, full_parser.stats)
+        self.assertEqual(parser.errors, full_parser.errors)
+
+        parser = ModuleParser(file_contents=self.file_contents)
+        parser.parse(resume_from=self.checkpoint_path)
+
+        self.assertEqual(parser.sheet_items, {})
+        self.assertEqual(parser.stats, full_parser.stats)
+
+    def test_missing_checkpoint(self):
+        parser = ModuleParser(file_contents=self.file_contents)
+        parser.parse(resume_from=self.checkpoint_path)
+
+        self.assertEqual(parser.stats['total_count'], 12)
+
+    def test_mismatched_checkpoint(self):
+        self.crash_after(5)
+        parser = ModuleParser(file_contents=make_xlsx(OrderedDict(first=[['foo', 'bar', 'baz']])))
+
+        with self.assertRaises(ValueError):
+            parser.parse(resume_from=self.checkpoint_path)
+
+
+class IncrementalTestCase(TestCase):
+    def setUp(self):
+        header = ['foo', 'bar', 'baz']
+        self.old_contents = make_xlsx(OrderedDict(
+            first=[header, ['a', 'bar', 'baz'], ['b', 'bar', 'baz'], ['', 'bar', 'baz'], ['d', 'bar', 'baz']],
+            second=[header, ['x', 'bar', 'baz']]
+        ))
+        self.new_contents = make_xlsx(OrderedDict(
+            first=[header, ['a', 'bar', 'baz'], ['B', 'bar', 'baz'], ['', 'bar', 'baz']],
+            second=[header, ['x', 'bar', 'baz'], ['y', 'bar', 'baz']]
+        ))
+
+    def test_incremental_parse(self):
+        old_parser = ModuleParser(file_contents=self.old_contents, incremental=True)
+        old_parser.parse()
+        manifest = pickle.loads(pickle.dumps(old_parser.get_manifest()))
+
+        self.assertEqual(old_parser.validated_count, 5)
+        self.assertIsNone(old_parser.changes)
+        self.assertEqual(len(manifest['rows']), 5)
+
+        full_parser = ModuleParser(file_contents=self.new_contents)
+        full_parser.parse()
+
+        parser = ModuleParser(file_contents=self.new_contents)
+        with mock.patch.object(ModuleParser.item_class, 'validate', autospec=True, side_effect=ModuleParser.item_class.validate) as validate:
+            parser.parse(manifest=manifest)
+
+        self.assertEqual(validate.call_count, 2)
+        self.assertEqual(parser.validated_count, 2)
+        self.assertEqual(parser.changes, dict(
+            inserted=[('second', 2)],
+            updated=[('first', 2)],
+            deleted=[('first', 4)]
+        ))
+        self.assertEqual(parser.get_cleaned_data(), full_parser.get_cleaned_data())
+        self.assertEqual(parser.stats, full_parser.stats)
+        self.assertEqual(parser.errors, full_parser.errors)
+
+    def test_changed_parser(self):
+        old_parser = ModuleParser(file_contents=self.old_contents, incremental=True)
+        old_parser.parse()
+
+        class ChangedParser(ModuleParser):
+            baz = fields.CharField(header='baz', validators=[validators.ChoicesValidator(['baz'])])
+
+        parser = ChangedParser(file_contents=self.new_contents)
+        parser.parse(manifest=old_parser.get_manifest())
+
+        self.assertEqual(parser.validated_count, 5)
+        self.assertEqual(parser.changes['updated'], [('first', 2)])
+
+
+class CategoricalParserTestCase(TestCase):
+    def test_get_categories(self):
+        class CategoricalParser(parsers.Parser):
+            foo = fields.CharField(header='foo', categorical=True)
+            bar = fields.CharField(header='bar')
+
+        file_contents = make_xlsx(OrderedDict(sheet=[['foo', 'bar'], ['b', 'x'], [' a', 'y'], ['b ', 'z']]))
+        parser = CategoricalParser(file_contents=file_contents)
+        parser.parse()
+
+        self.assertEqual(parser.get_categories(), dict(foo=['b', 'a']))
+        self.assertEqual([item.get_code('foo') for items in parser.values() for item in items], [0, 1, 0])
@@ -0,0 +1,252 @@
+import io
+import os
+import mmap
+import datetime
+import tempfile
+from collections import OrderedDict
+from unittest import TestCase
+from unittest import mock
+
+import xlrd
+
+from sw_excel_parser import fields
+from sw_excel_parser import parsers
+from sw_excel_parser import readers
+from sw_excel_parser.tests.utils import make_xlsx, workbook_rows
+
+
+class XlrdReaderTestCase(TestCase):
+    file_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'test_book.xls')
+
+    def setUp(self):
+        with open(self.file_path, 'rb') as workbook_file:
+            self.file_contents = workbook_file.read()
+
+        self.reader = readers.XlrdReader(file_contents=self.file_contents)
+
+    def test_match(self):
+        self.assertIs(readers.get_reader_class(self.file_contents), readers.XlrdReader)
+
+    def test_iter_rows(self):
+        sheet = self.reader.get_sheets()[1]
+
+        self.assertEqual(list(self.reader.iter_rows(sheet, start=1, stop=2)), [(1, ['foo', ' bAr', '   BaZ'])])
+        self.assertEqual(len(list(self.reader.iter_rows(sheet, stop=100))), 3)
+        self.assertEqual(self.reader.row_values(sheet, 2), ['fred', 'plugh', 'xyzzy'])
+
+    def test_date_cells(self):
+        sheet = mock.Mock(nrows=1)
+        sheet.row_values.return_value = ['foo', 43000.5, 43000.0]
+        sheet.row_types.return_value = [xlrd.XL_CELL_TEXT, xlrd.XL_CELL_DATE, xlrd.XL_CELL_NUMBER]
+
+        self.assertEqual(
+            list(self.reader.iter_rows(sheet)),
+            [(0, ['foo', datetime.datetime(2017, 9, 22, 12), 43000.0])]
+        )
+
+    def test_on_demand(self):
+        reader = readers.XlrdReader(file_contents=self.file_contents, on_demand=True)
+        sheets = reader.get_sheets()
+
+        self.assertFalse(reader.workbook.sheet_loaded(0))
+
+        sheet = next(sheets)
+        self.assertTrue(reader.workbook.sheet_loaded(0))
+
+        reader.release_sheet(sheet)
+        self.assertFalse(reader.workbook.sheet_loaded(0))
+
+
+class XlsxReaderTestCase(TestCase):
+    def setUp(self):
+        self.workbook = xlrd.open_workbook(XlrdReaderTestCase.file_path)
+        self.file_contents = make_xlsx(
+            OrderedDict(
+                (name, [[value if value != '' else None for value in row] for row in rows])
+                for name, rows in workbook_rows(self.workbook)
+            )
+        )
+        self.reader = readers.XlsxReader(file_contents=self.file_contents)
+
+        class TestParser(parsers.Parser):
+            foo = fields.CharField(header='foo')
+            bar = fields.CharField(header='bar')
+            baz = fields.CharField(header='baz')
+
+        self.parser_class = TestParser
+
+    def test_match(self):
+        self.assertIs(readers.get_reader_class(self.file_contents), readers.XlsxReader)
+
+    def test_get_sheets(self):
+        self.assertEqual([sheet.name for sheet in self.reader.get_sheets()], self.workbook.sheet_names())
+
+    def test_iter_rows(self):
+        sheet = self.reader.get_sheets()[0]
+        rows = list(self.reader.iter_rows(sheet))
+
+        self.assertEqual([nrow for nrow, row_values in rows], list(range(6)))
+        self.assertEqual(rows[4], (4, ['', '', 'Foo ', '  Bar ', 'Baz']))
+        self.assertEqual(rows[3], (3, []))
+        self.assertEqual(list(self.reader.iter_rows(sheet, start=5)), [(5, ['', '', 'grault', '', 'waldo'])])
+        self.assertEqual(list(self.reader.iter_rows(sheet, start=2, stop=4)), [(2, ['Data']), (3, [])])
+
+    def test_cell_values(self):
+        file_contents = make_xlsx(OrderedDict(sheet=[['text', 1.5, 10], [None, None, 'last']]))
+        reader = readers.XlsxReader(file_contents=file_contents)
+        sheet = reader.get_sheets()[0]
+
+        self.assertEqual(list(reader.iter_rows(sheet)), [(0, ['text', 1.5, 10.0]), (1, ['', '', 'last'])])
+
+    def test_date_cells(self):
+        file_contents = make_xlsx(OrderedDict(sheet=[[datetime.date(2017, 9, 22), 43000.0]]))
+        reader = readers.XlsxReader(file_contents=file_contents)
+        sheet = reader.get_sheets()[0]
+
+        self.assertEqual(reader.row_values(sheet, 0), [datetime.datetime(2017, 9, 22), 43000.0])
+
+    def test_parse(self):
+        xlsx_parser = self.parser_class(file_contents=self.file_contents)
+        xls_parser = self.parser_class(workbook=self.workbook)
+
+        xlsx_parser.parse()
+        xls_parser.parse()
+
+        self.assertIsInstance(xlsx_parser.reader, readers.XlsxReader)
+        self.assertEqual(list(xlsx_parser.find_headers().values()), [4, 1])
+        self.assertEqual(xlsx_parser.get_cleaned_data(), xls_parser.get_cleaned_data())
+        self.assertEqual(xlsx_parser.stats, xls_parser.stats)
+
+
+
+class CsvReaderTestCase(TestCase):
+    def setUp(self):
+        self.text = 'Отчёт\n\nfoo;bar;baz\nqux;"quux; corge";grault\n;;waldo\n'
+
+        class TestParser(parsers.Parser):
+            foo = fields.CharField(header='foo')
+            bar = fields.CharField(header='bar')
+            baz = fields.CharField(header='baz')
+
+        self.parser_class = TestParser
+
+    def test_match(self):
+        self.assertIs(readers.get_reader_class(self.text.encode('cp1251')), readers.CsvReader)
+
+    def test_detection(self):
+        reader = readers.CsvReader(file_contents=self.text.encode('cp1251'))
+        sheet = reader.get_sheets()[0]
+
+        self.assertEqual(list(reader.iter_rows(sheet, start=2, stop=4)), [
+            (2, ['foo', 'bar', 'baz']),
+            (3, ['qux', 'quux; corge', 'grault'])
+        ])
+        self.assertEqual(reader.encoding, 'cp1251')
+        self.assertEqual(reader.delimiter, ';')
+        self.assertEqual(reader.row_values(sheet, 0), ['Отчёт'])
+
+    def test_path(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'partner.tsv')
+            with open(path, 'w', encoding='utf-8-sig', newline='') as csv_file:
+                csv_file.write(self.text.replace(';', '\t'))
+
+            reader = readers.CsvReader(path)
+            rows = list(reader.iter_rows(reader.get_sheets()[0]))
+
+        self.assertEqual(reader.get_sheets()[0].name, 'partner')
+        self.assertEqual(reader.delimiter, '\t')
+        self.assertEqual(rows[0], (0, ['Отчёт']))
+        self.assertEqual(len(rows), 5)
+
+    def test_parse(self):
+        file_object = io.BytesIO(self.text.encode('utf-8'))
+        parser = self.parser_class(workbook=readers.CsvReader(file_object))
+        parser.parse()
+
+        self.assertEqual(list(parser.find_headers().values()), [2])
+        self.assertEqual(parser.get_cleaned_data(), dict(csv=[dict(foo='qux', bar='quux; corge', baz='grault'), dict(baz='waldo')]))
+        self.assertEqual(parser.stats['total_count'], 2)
+        self.assertFalse(file_object.closed)
+
+        bytes_parser = self.parser_class(file_contents=self.text.encode('cp1251'))
+        bytes_parser.parse()
+
+        self.assertIsInstance(bytes_parser.reader, readers.CsvReader)
+        self.assertEqual(list(bytes_parser.get_cleaned_data().values()), list(parser.get_cleaned_data().values()))
+
+
+class SourceTestCase(TestCase):
+    def setUp(self):
+        self.file_contents = make_xlsx(OrderedDict(sheet=[['foo', 'bar'], ['qux', 1.0], ['', 2.0]]))
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'upload.xlsx')
+        with open(self.path, 'wb') as upload_file:
+            upload_file.write(self.file_contents)
+
+        class TestParser(parsers.Parser):
+            foo = fields.CharField(header='foo')
+            bar = fields.FloatField(header='bar')
+
+        self.parser_class = TestParser
+        self.parser = self.parser_class(file_contents=self.file_contents)
+        self.parser.parse()
+
+    def assertParsed(self, parser):
+        parser.parse()
+
+        self.assertEqual(parser.get_cleaned_data(), self.parser.get_cleaned_data())
+        self.assertEqual(parser.stats, self.parser.stats)
+
+    def test_path(self):
+        parser = self.parser_class(workbook=self.path)
+
+        self.assertIsInstance(parser.file_contents, mmap.mmap)
+        self.assertIsInstance(parser.reader, readers.XlsxReader)
+        self.assertParsed(parser)
+
+    def test_file_object(self):
+        with open(self.path, 'rb') as upload_file:
+            parser = self.parser_class(workbook=upload_file)
+
+        self.assertIsInstance(parser.file_contents, mmap.mmap)
+        self.assertParsed(parser)
+
+        parser = self.parser_class(workbook=io.BytesIO(self.file_contents))
+        self.assertEqual(parser.file_contents, self.file_contents)
+        self.assertParsed(parser)
+
+    def test_memoryview(self):
+        parser = self.parser_class(file_contents=memoryview(self.file_contents))
+
+        self.assertIs(parser.file_contents, self.file_contents)
+        self.assertParsed(parser)
+
+        padded = memoryview(b'\x00' + self.file_contents)[1:]
+        self.assertParsed(self.parser_class(file_contents=padded))
+
+    def test_xls_path(self):
+        parser = self.parser_class(workbook=XlrdReaderTestCase.file_path)
+
+        self.assertIsInstance(parser.reader, readers.XlrdReader)
+        self.assertEqual(parser.workbook.sheet_names(), ['Лист1', 'Лист2'])
+
+    def test_csv_path(self):
+        path = os.path.join(os.path.dirname(self.path), 'partner.csv')
+        with open(path, 'w', encoding='utf-8') as csv_file:
+            csv_file.write('foo,bar\nqux,1\n,2\n')
+
+        parser = self.parser_class(workbook=path)
+        parser.parse()
+
+        self.assertEqual(list(parser.get_cleaned_data()), ['partner'])
+        self.assertEqual(parser.stats, dict(self.parser.stats, erroneous_sheets=['partner']))
+
+    def test_buffer_stream(self):
+        stream = readers.BufferStream(bytearray(b'0123456789'))
+
+        self.assertEqual(stream.read(3), b'012')
+        self.assertEqual(stream.seek(-2, io.SEEK_END), 8)
+        self.assertEqual(stream.read(), b'89')
+        self.assertEqual(stream.read(), b'')
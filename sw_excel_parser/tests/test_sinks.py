@@ -0,0 +1,57 @@
+import io
+import csv
+import json
+import sqlite3
+from collections import OrderedDict
+from unittest import TestCase
+
+from sw_excel_parser import fields
+from sw_excel_parser import parsers
+from sw_excel_parser import sinks
+from sw_excel_parser.tests.utils import make_xlsx
+
+
+class SinkParser(parsers.Parser):
+    foo = fields.CharField(header='foo')
+    bar = fields.IntegerField(header='bar')
+
+
+class SinksTestCase(TestCase):
+    def setUp(self):
+        rows = [['foo', 'bar'], ['a', 1], ['b', 'x'], ['c', 3]]
+        self.file_contents = make_xlsx(OrderedDict(first=rows, second=rows))
+
+    def test_csv_sink(self):
+        valid_file, invalid_file = io.StringIO(), io.StringIO()
+        parser = SinkParser(file_contents=self.file_contents)
+        parser.export(sinks.CsvSink(valid_file), sinks.CsvSink(invalid_file), batch_size=1)
+
+        self.assertEqual(list(csv.reader(io.StringIO(valid_file.getvalue()))), [
+            ['foo', 'bar'], ['a', '1'], ['c', '3'], ['a', '1'], ['c', '3']
+        ])
+        self.assertEqual(list(csv.reader(io.StringIO(invalid_file.getvalue()))), [
+            ['sheet', 'nrow', 'foo', 'bar', 'errors'],
+            ['first', '2', 'b', 'x', 'bar: Некорректное значение.'],
+            ['second', '2', 'b', 'x', 'bar: Некорректное значение.']
+        ])
+        self.assertEqual(parser.stats['total_count'], 6)
+        self.assertEqual(parser.sheet_items, {})
+
+    def test_json_lines_sink(self):
+        valid_file = io.StringIO()
+        SinkParser(file_contents=self.file_contents).export(valid_sink=sinks.JsonLinesSink(valid_file))
+
+        self.assertEqual(
+            [json.loads(line) for line in valid_file.getvalue().splitlines()],
+            [dict(foo='a', bar=1), dict(foo='c', bar=3)] * 2
+        )
+
+    def test_db_api_sink(self):
+        connection = sqlite3.connect(':memory:')
+        self.addCleanup(connection.close)
+        connection.execute('CREATE TABLE rows (foo TEXT, bar INTEGER)')
+
+        with sinks.DbApiSink(connection, 'rows') as sink:
+            SinkParser(file_contents=self.file_contents).export(valid_sink=sink, batch_size=2)
+
+        self.assertEqual(connection.execute('SELECT foo, bar FROM rows').fetchall(), [('a', 1), ('c', 3)] * 2)
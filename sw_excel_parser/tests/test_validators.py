@@ -63,3 +63,31 @@ class EmailValidatorTestCase(TestCase):
             self.validator(self.field, 'wrong_email')
 
         self.assertEqual(str(e.exception), self.validator.message)
+
+
+class UniqueValidatorTestCase(TestCase):
+    def setUp(self):
+        self.validator = validators.UniqueValidator()
+        self.field = mock.Mock(spec=fields.CharField)
+
+    def test_validator(self):
+        context = {}
+        errors = self.validator.validate_batch(self.field, [1, 2, 3, 4], ['foo', 'bar', 'foo', None], context)
+
+        self.assertEqual(list(errors), [3])
+        self.assertEqual(str(errors[3]), self.validator.message)
+
+        errors = self.validator.validate_batch(self.field, [5, 6], ['bar', 'baz'], context)
+        self.assertEqual(list(errors), [5])
+
+
+class ChoicesValidatorTestCase(TestCase):
+    def setUp(self):
+        self.validator = validators.ChoicesValidator(['foo', 'bar'])
+        self.field = mock.Mock(spec=fields.CharField)
+
+    def test_validator(self):
+        errors = self.validator.validate_batch(self.field, [1, 2, 3], ['foo', 'baz', None], {})
+
+        self.assertEqual(list(errors), [2])
+        self.assertEqual(str(errors[2]), self.validator.message)
@@ -0,0 +1,106 @@
+import io
+import zipfile
+import datetime
+from xml.sax.saxutils import escape, quoteattr
+
+from sw_excel_parser import readers
+
+CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '</Types>'
+)
+MAIN_NS = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+REL_NS = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+PACKAGE_REL_NS = 'http://schemas.openxmlformats.org/package/2006/relationships'
+EXCEL_EPOCH = datetime.datetime(1899, 12, 30)
+
+
+def column_reference(index):
+    reference = ''
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        reference = chr(ord('A') + remainder) + reference
+
+    return reference
+
+
+def make_xlsx(sheets):
+    shared_strings = []
+    shared_index = {}
+    sheet_documents = []
+
+    for rows in sheets.values():
+        xml_rows = []
+        for nrow, row in enumerate(rows):
+            if row is None:
+                continue
+
+            cells = []
+            for ncol, value in enumerate(row):
+                reference = '{}{}'.format(column_reference(ncol), nrow + 1)
+                if value is None:
+                    continue
+                elif isinstance(value, datetime.date):
+                    if not isinstance(value, datetime.datetime):
+                        value = datetime.datetime.combine(value, datetime.time())
+                    serial = (value - EXCEL_EPOCH).total_seconds() / 86400
+                    cells.append('<c r="{}" s="1"><v>{}</v></c>'.format(reference, serial))
+                elif isinstance(value, str):
+                    if value not in shared_index:
+                        shared_index[value] = len(shared_strings)
+                        shared_strings.append(value)
+                    cells.append('<c r="{}" t="s"><v>{}</v></c>'.format(reference, shared_index[value]))
+                else:
+                    cells.append('<c r="{}"><v>{}</v></c>'.format(reference, value))
+
+            xml_rows.append('<row r="{}">{}</row>'.format(nrow + 1, ''.join(cells)))
+
+        sheet_documents.append(
+            '<worksheet xmlns="{}"><sheetData>{}</sheetData></worksheet>'.format(MAIN_NS, ''.join(xml_rows))
+        )
+
+    workbook = '<workbook xmlns="{}" xmlns:r="{}"><sheets>{}</sheets></workbook>'.format(
+        MAIN_NS, REL_NS,
+        ''.join(
+            '<sheet name={} sheetId="{}" r:id="rId{}"/>'.format(quoteattr(name), index + 1, index + 1)
+            for index, name in enumerate(sheets)
+        )
+    )
+    relationships = '<Relationships xmlns="{}">{}</Relationships>'.format(
+        PACKAGE_REL_NS,
+        ''.join(
+            '<Relationship Id="rId{0}" Target="worksheets/sheet{0}.xml" Type="{1}/worksheet"/>'.format(index + 1, REL_NS)
+            for index in range(len(sheets))
+        )
+    )
+    styles = (
+        '<styleSheet xmlns="{}"><cellXfs count="2"><xf numFmtId="0"/><xf numFmtId="14"/></cellXfs></styleSheet>'
+    ).format(MAIN_NS)
+    strings = '<sst xmlns="{}">{}</sst>'.format(
+        MAIN_NS, ''.join('<si><t>{}</t></si>'.format(escape(value)) for value in shared_strings)
+    )
+
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr('[Content_Types].xml', CONTENT_TYPES)
+        archive.writestr('xl/workbook.xml', workbook)
+        archive.writestr('xl/_rels/workbook.xml.rels', relationships)
+        archive.writestr('xl/sharedStrings.xml', strings)
+        archive.writestr('xl/styles.xml', styles)
+        for index, document in enumerate(sheet_documents):
+            archive.writestr('xl/worksheets/sheet{}.xml'.format(index + 1), document)
+
+    return buffer.getvalue()
+
+
+def workbook_rows(workbook):
+    reader = readers.XlrdReader(workbook=workbook)
+
+    return [
+        (sheet.name, [row_values for nrow, row_values in reader.iter_rows(sheet)])
+        for sheet in reader.get_sheets()
+    ]
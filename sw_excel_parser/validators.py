@@ -23,6 +23,10 @@ class RequiredValidator(Validator):
 
         return value
 
+    def check_column(self, field, array):
+        if field.required:
+            return array == 0
+
 
 class MinValueValidator(Validator):
     message = 'Значение меньше допустимого.'
@@ -33,6 +37,10 @@ class MinValueValidator(Validator):
 
         return value
 
+    def check_column(self, field, array):
+        if field.min_value:
+            return array < field.min_value
+
 
 class MaxValueValidator(Validator):
     message = 'Значение больше допустимого.'
@@ -43,6 +51,10 @@ class MaxValueValidator(Validator):
 
         return value
 
+    def check_column(self, field, array):
+        if field.max_value:
+            return array > field.max_value
+
 
 class EmailValidator(Validator):
     message = 'Невалидный email адрес.'
@@ -53,3 +65,40 @@ class EmailValidator(Validator):
             raise ValidationError(self.message)
 
         return value
+
+
+class BatchValidator(Validator):
+    def validate_batch(self, field, nrows, values, context):
+        raise NotImplementedError
+
+
+class UniqueValidator(BatchValidator):
+    message = 'Значение не уникально.'
+
+    def validate_batch(self, field, nrows, values, context):
+        seen = context.setdefault('seen', set())
+        errors = {}
+        for nrow, value in zip(nrows, values):
+            if value is None:
+                continue
+            elif value in seen:
+                errors[nrow] = ValidationError(self.message)
+            else:
+                seen.add(value)
+
+        return errors
+
+
+class ChoicesValidator(BatchValidator):
+    message = 'Недопустимое значение.'
+
+    def __init__(self, choices, message: str = None, *args, **kwargs):
+        super().__init__(message, *args, **kwargs)
+        self.choices = frozenset(choices)
+
+    def validate_batch(self, field, nrows, values, context):
+        return {
+            nrow: ValidationError(self.message)
+            for nrow, value in zip(nrows, values)
+            if value is not None and value not in self.choices
+        }